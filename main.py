@@ -15,6 +15,10 @@ from poker.agents import AdvancedPlayer, ComputerPlayer, HumanPlayer, RandomPlay
 from poker.engine import Game
 from poker.models import Agent
 
+# AI player classes to pick from, and the name prefix used for each
+PLAYER_TYPES = (ComputerPlayer, RandomPlayer, AdvancedPlayer)
+PLAYER_PREFIXES = {cls: cls.__name__.upper()[:3] for cls in PLAYER_TYPES}
+
 
 def run_game(
     num_cpu_players: int = 3,
@@ -36,11 +40,10 @@ def run_game(
     human: HumanPlayer = HumanPlayer("You", initial_chips=starting_chips)
 
     # Create players with random types
-    player_types = [ComputerPlayer, RandomPlayer, AdvancedPlayer]
+    chosen = random.choices(PLAYER_TYPES, k=num_cpu_players)
     computer_players = [
-        player_type(f"{player_type.__name__.upper()[:3]}_{i + 1}", starting_chips)
-        for i in range(num_cpu_players)
-        for player_type in [random.choice(player_types)]
+        player_type(f"{PLAYER_PREFIXES[player_type]}_{i + 1}", starting_chips)
+        for i, player_type in enumerate(chosen)
     ]
 
     all_players: List[Agent] = [human] + computer_players
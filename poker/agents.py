@@ -303,13 +303,12 @@ class AdvancedPlayer(Agent):
         elif active_players <= 3:
             position = "late"
 
-        # Evaluate board texture
-        board_cards = info_set.community_cards
-        has_pair = len(board_cards) >= 2 and any(
-            board_cards[i].rank == board_cards[j].rank
-            for i in range(len(board_cards))
-            for j in range(i + 1, len(board_cards))
-        )
+        # Evaluate board texture: count the board's ranks in a fixed list
+        # indexed by rank value
+        rank_counts = [0] * 15
+        for card in info_set.community_cards:
+            rank_counts[card.rank] += 1
+        has_pair = max(rank_counts) >= 2
 
         # Adjust strategy based on position and board
         if position == "late":
@@ -1,4 +1,3 @@
-import copy
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
@@ -7,6 +6,39 @@ from poker.evaluator import HandEvaluator
 from poker.logger import ConsoleLogger
 from poker.models import Action, ActionType, Agent, Card, Deck, InformationSet
 
+# Betting action types, bound once for the per-action branches below
+_FOLD = ActionType.FOLD
+_CHECK = ActionType.CHECK
+_CALL = ActionType.CALL
+_BET = ActionType.BET
+_RAISE = ActionType.RAISE
+_ALL_IN = ActionType.ALL_IN
+
+# Statistics counter incremented for each processed action type
+ACTION_STAT_KEYS = {
+    ActionType.FOLD: "folds",
+    ActionType.CHECK: "checks",
+    ActionType.CALL: "calls",
+    ActionType.BET: "bets",
+    ActionType.RAISE: "raises",
+    ActionType.ALL_IN: "all_ins",
+}
+
+# Integer counters every game's statistics start with, all at zero
+STATS_COUNTER_KEYS = (
+    "hands_played",
+    "showdowns",
+    "folds",
+    "checks",
+    "calls",
+    "bets",
+    "raises",
+    "all_ins",
+    "errors",
+    "chip_accounting_errors",
+    "biggest_pot",
+)
+
 
 @dataclass
 class Board:
@@ -20,14 +52,40 @@ class Board:
 
 
 class Game:
+    # Fixed attribute layout: the game loop reads these on every action
+    __slots__ = (
+        "players",
+        "small_blind",
+        "big_blind",
+        "deck",
+        "community_cards",
+        "pot",
+        "current_bet",
+        "dealer_idx",
+        "info_set",
+        "current_round",
+        "logger",
+        "eliminated_players",
+        "initial_total_chips",
+        "hand_counter",
+        "retain_actions",
+        "actions_taken",
+        "round_pots",
+        "stats",
+    )
+
     def __init__(
-        self, players: List[Agent], small_blind: int = 5, big_blind: int = 10
+        self,
+        players: List[Agent],
+        small_blind: int = 5,
+        big_blind: int = 10,
+        retain_actions: bool = False,
     ) -> None:
         self.players: List[Agent] = players
         self.small_blind: int = small_blind
         self.big_blind: int = big_blind
         self.deck: Optional[Deck] = None
-        self.community_cards: List[Card] = []
+        self.community_cards: Tuple[Card, ...] = ()
         self.pot: int = 0
         self.current_bet: int = 0
         self.dealer_idx: int = 0
@@ -43,83 +101,129 @@ class Game:
 
         # Statistics tracking
         self.hand_counter = 0
-        self.actions_taken = []
+        # Every processed action across all hands; only kept when requested
+        # since it grows for the lifetime of the game
+        self.retain_actions: bool = retain_actions
+        self.actions_taken: List[Action] = []
         self.round_pots = []
 
         # Initialize statistics dictionary
-        self.stats = {
-            "hands_played": 0,
-            "showdowns": 0,
-            "folds": 0,
-            "checks": 0,
-            "calls": 0,
-            "bets": 0,
-            "raises": 0,
-            "all_ins": 0,
-            "errors": 0,
-            "chip_accounting_errors": 0,
-            "biggest_pot": 0,
-            "player_wins": {player.name: 0 for player in players},
-            "final_chips": {player.name: player.chips for player in players},
-            "eliminated": {player.name: False for player in players},
-        }
+        self.stats = dict.fromkeys(STATS_COUNTER_KEYS, 0)
+        self.stats["player_wins"] = {player.name: 0 for player in players}
+        self.stats["final_chips"] = {player.name: player.chips for player in players}
+        self.stats["eliminated"] = {player.name: False for player in players}
 
-    def build_information_set(
-        self, current_player_idx: Optional[int] = None
-    ) -> InformationSet:
-        """Build an information set based on the current game state"""
-        # Create a new information set but preserve the action history
-        action_history = (
-            self.info_set.action_history.copy()
-            if hasattr(self, "info_set") and self.info_set
-            else []
-        )
+    def reset(self, players: Optional[List[Agent]] = None) -> None:
+        """Reset per-game state so this instance can play a fresh game.
+
+        The statistics containers are zeroed in place rather than rebuilt.
+
+        Args:
+            players: Players for the new game; defaults to the current ones
+        """
+        if players is not None:
+            self.players = players
+        players = self.players
 
+        self.deck = None
+        self.community_cards = ()
+        self.pot = 0
+        self.current_bet = 0
+        self.dealer_idx = 0
         self.info_set = InformationSet()
-        self.info_set.action_history = action_history  # Restore the action history
-        self.info_set.community_cards = self.community_cards.copy()
-        self.info_set.pot = self.pot
-        self.info_set.current_bet = self.current_bet
-        self.info_set.dealer_position = self.dealer_idx
-        self.info_set.current_round = self.current_round
-        self.info_set.min_call_amount = 0  # Will be set for each player
+        self.current_round = ""
+        self.eliminated_players.clear()
+        self.initial_total_chips = sum(player.chips for player in players)
+        self.hand_counter = 0
+        self.actions_taken.clear()
+        self.round_pots.clear()
+
+        stats = self.stats
+        for key in STATS_COUNTER_KEYS:
+            stats[key] = 0
+        player_wins = stats["player_wins"]
+        final_chips = stats["final_chips"]
+        eliminated = stats["eliminated"]
+        player_wins.clear()
+        final_chips.clear()
+        eliminated.clear()
+        for player in players:
+            player_wins[player.name] = 0
+            final_chips[player.name] = player.chips
+            eliminated[player.name] = False
+
+    def build_information_set(
+        self,
+        current_player_idx: Optional[int] = None,
+        min_call_override: Optional[int] = None,
+    ) -> InformationSet:
+        """Build an information set based on the current game state
+
+        Args:
+            current_player_idx: Seat of the player about to act, if any
+            min_call_override: Amount to report as the minimum call instead of
+                the one derived from the bets
+        """
+        # The hand's information set is updated in place rather than rebuilt
+        # each turn; its action history is already current since every
+        # processed action is added to it
+        info_set = self.info_set
+        action_history = info_set.action_history
+        # The board is a tuple, so the information set can share it
+        info_set.community_cards = tuple(self.community_cards)
+        info_set.pot = self.pot
+        info_set.current_bet = self.current_bet
+        info_set.dealer_position = self.dealer_idx
+        info_set.current_round = self.current_round
+        info_set.active_player = None
+        info_set.min_call_amount = 0  # Will be set for each player
 
         # Find big blind amount from action history
         big_blind_amount = self.big_blind  # Default value
         for action in action_history:
-            if action.action_type == ActionType.BIG_BLIND:
+            if action.action_type is ActionType.BIG_BLIND:
                 big_blind_amount = action.amount
                 break
 
-        self.info_set.big_blind = big_blind_amount
+        info_set.big_blind = big_blind_amount
 
         # Set player states
+        player_states = info_set.player_states
         active_players = 0
         for i, player in enumerate(self.players):
             is_active = current_player_idx == i
-            is_human = isinstance(player, HumanPlayer)
-            is_dealer = self.dealer_idx == i
 
             if not player.folded and player.chips > 0:
                 active_players += 1
 
             # Calculate min call amount for the active player
             if is_active:
-                self.info_set.active_player = player
-                self.info_set.min_call_amount = self.current_bet - player.current_bet
-
-            self.info_set.player_states[player.name] = {
-                "chips": player.chips,
-                "current_bet": player.current_bet,
-                "folded": player.folded,
-                "is_active": is_active,
-                "is_human": is_human,
-                "is_dealer": is_dealer,
-                "hand": player.hand,
-            }
-
-        self.info_set.num_active_players = active_players
-        return self.info_set
+                info_set.active_player = player
+                info_set.min_call_amount = self.current_bet - player.current_bet
+
+            state = player_states.get(player.name)
+            if state is None:
+                player_states[player.name] = {
+                    "chips": player.chips,
+                    "current_bet": player.current_bet,
+                    "folded": player.folded,
+                    "is_active": is_active,
+                    "is_human": isinstance(player, HumanPlayer),
+                    "is_dealer": self.dealer_idx == i,
+                    "hand": player.hand,
+                }
+            else:
+                state["chips"] = player.chips
+                state["current_bet"] = player.current_bet
+                state["folded"] = player.folded
+                state["is_active"] = is_active
+                state["is_dealer"] = self.dealer_idx == i
+                state["hand"] = player.hand
+
+        info_set.num_active_players = active_players
+        if min_call_override is not None:
+            info_set.min_call_amount = min_call_override
+        return info_set
 
     def start_game(self) -> None:
         self.logger.log_game_start(
@@ -130,20 +234,35 @@ class Game:
             # Play a hand
             self.play_hand()
 
-            # Remove players with 0 chips
-            self.players = [p for p in self.players if p.chips > 0]
-
             # If fewer than 2 players remain, end the game
-            if len(self.players) < 2:
+            if not self.advance_to_next_hand():
                 self.logger.info("Game ended: only one player remains")
                 break
 
-            # Update dealer position for next hand
-            if self.players:  # Make sure there are still players
-                self.dealer_idx = (self.dealer_idx + 1) % len(self.players)
-
             input("\nPress Enter to start the next hand...")
 
+    def advance_to_next_hand(self) -> bool:
+        """Remove busted players and move the dealer button.
+
+        Returns:
+            True if at least two players remain to play another hand
+        """
+        self.remove_busted_players()
+
+        if len(self.players) < 2:
+            return False
+
+        # Update dealer position for next hand
+        self.dealer_idx = (self.dealer_idx + 1) % len(self.players)
+        return True
+
+    def remove_busted_players(self) -> None:
+        """Drop players with no chips left from the game, in place."""
+        # Most hands bust nobody, so only rewrite the list when needed
+        players = self.players
+        if not all(p.chips for p in players):
+            players[:] = [p for p in players if p.chips]
+
     def play_hand(self) -> None:
         """Play a single hand of poker"""
         # Increment hand counter
@@ -169,29 +288,29 @@ class Game:
         self.current_bet = 0
         self.deck = Deck()
         self.deck.shuffle()
-        self.community_cards = []
+        self.community_cards = ()
         self.info_set = InformationSet(
             big_blind=self.big_blind,
             small_blind=self.small_blind,
         )
 
-        # Reset player states
+        # Reset player states; a player starting the hand without chips has
+        # nothing to play for and sits it out
         for player in self.players:
-            player.folded = False
+            player.folded = player.chips == 0
             player.current_bet = 0
-            player.hand = []
+            player.hand = ()
 
-        # Store starting chips for this hand
-        starting_chips = {player.name: player.chips for player in self.players}
+        # Store starting chips for this hand, in seat order
+        starting_chips = [player.chips for player in self.players]
 
-        # Log the start of a new hand
-        self.logger.info("=" * 24)
-        self.logger.info(f"=== Starting New Hand ===")
-        self.logger.info(f"Dealer: {self.players[self.dealer_idx].name}")
-
-        # Log the state of each player
-        for player in self.players:
-            self.logger.log_player_state(player)
+        # Log the start of a new hand and the state of each player
+        if self.logger.is_enabled():
+            self.logger.info("=" * 24)
+            self.logger.info(f"=== Starting New Hand ===")
+            self.logger.info(f"Dealer: {self.players[self.dealer_idx].name}")
+            for player in self.players:
+                self.logger.log_player_state(player)
 
         # Post blinds
         self.logger.info("=== Starting Round: Blinds ===")
@@ -306,7 +425,7 @@ class Game:
 
     def deal_community_cards(self, count: int) -> None:
         new_cards = self.deck.deal(count)
-        self.community_cards.extend(new_cards)
+        self.community_cards = (*self.community_cards, *new_cards)
 
         # Log the new community cards and current board state
         self.logger.log_community_cards(new_cards, self.community_cards)
@@ -340,8 +459,12 @@ class Game:
         )
 
         # Track starting chips for this round to calculate chip changes
-        starting_chips = {player.name: player.chips for player in players}
-        starting_total_chips = sum(starting_chips.values()) + self.pot
+        starting_chips = [player.chips for player in players]
+        starting_total_chips = sum(starting_chips) + self.pot
+
+        # Seat to the left of each seat, so moving on is one list index
+        # rather than a modulo per turn
+        next_seat: List[int] = [*range(1, len(players)), 0]
 
         # First player to act
         current_idx: int = start_idx
@@ -356,7 +479,7 @@ class Game:
         while True:
             # Skip players who have folded or are all-in
             if players[current_idx].folded or players[current_idx].chips == 0:
-                current_idx = (current_idx + 1) % len(players)
+                current_idx = next_seat[current_idx]
                 continue
 
             # Build information set for the current player
@@ -367,7 +490,7 @@ class Game:
                 # For human players, show the formatted information set
                 self.logger.display_information_set(info_set)
                 self.logger.display_action_options(info_set)
-            else:
+            elif self.logger.is_enabled():
                 # For non-human players, just log their turn
                 self.logger.info(f"{players[current_idx].name}'s turn to act")
 
@@ -381,36 +504,30 @@ class Game:
             self.info_set.add_action(action)
 
             # Process action
-            if action.action_type == ActionType.FOLD:
+            if action.action_type is _FOLD:
                 players[current_idx].folded = True
                 self.logger.log_action(action)
                 # Add to acted_since_last_raise
                 acted_since_last_raise.add(current_idx)
-                # Update statistics
-                self.stats["folds"] += 1
 
-            elif action.action_type == ActionType.CHECK:
+            elif action.action_type is _CHECK:
                 # Can only check if no current bet
                 if self.current_bet > players[current_idx].current_bet:
                     self.logger.warning(
                         f"Error: Player {players[current_idx].name} attempted to check when there is a bet"
                     )
                     # Convert to a call
-                    action.action_type = ActionType.CALL
+                    action.action_type = _CALL
                     action.amount = self.current_bet - players[current_idx].current_bet
                     players[current_idx].chips -= action.amount
                     players[current_idx].current_bet += action.amount
                     self.pot += action.amount
-                    # Update statistics
-                    self.stats["calls"] += 1
                 else:
                     self.logger.log_action(action)
-                    # Update statistics
-                    self.stats["checks"] += 1
                 # Add to acted_since_last_raise
                 acted_since_last_raise.add(current_idx)
 
-            elif action.action_type == ActionType.CALL:
+            elif action.action_type is _CALL:
                 # Calculate the correct call amount (never negative)
                 min_call_amount = max(
                     0, self.current_bet - players[current_idx].current_bet
@@ -420,27 +537,24 @@ class Game:
                 call_amount = min(min_call_amount, players[current_idx].chips)
 
                 # Log for debugging
-                self.logger.debug(
-                    f"{players[current_idx].name} needs to call ${min_call_amount}, contributing ${call_amount}"
-                )
+                if self.logger.is_enabled():
+                    self.logger.debug(
+                        f"{players[current_idx].name} needs to call ${min_call_amount}, contributing ${call_amount}"
+                    )
 
                 # Check if this is an all-in call (player doesn't have enough to make a full call)
                 if (
                     call_amount == players[current_idx].chips
                     and call_amount < min_call_amount
                 ):
-                    action.action_type = ActionType.ALL_IN
+                    action.action_type = _ALL_IN
                     action.amount = call_amount
                     self.logger.warning(
                         f"{players[current_idx].name} doesn't have enough chips to call. Going ALL-IN with ${call_amount} more"
                     )
-                    # Update statistics
-                    self.stats["all_ins"] += 1
                 else:
                     # It's a regular call
                     action.amount = call_amount
-                    # Update statistics
-                    self.stats["calls"] += 1
 
                 # Update player chips and current bet
                 players[current_idx].chips -= call_amount
@@ -451,18 +565,8 @@ class Game:
                 # Add to acted_since_last_raise
                 acted_since_last_raise.add(current_idx)
 
-            elif action.action_type in [ActionType.BET, ActionType.RAISE]:
-                # Ensure bet meets minimum requirements
-                if action.action_type == ActionType.BET:
-                    # Minimum bet is the big blind
-                    min_bet_amount = self.big_blind
-                    if action.amount < min_bet_amount:
-                        action.amount = min_bet_amount
-                else:  # RAISE
-                    # Minimum raise is the current bet plus the big blind
-                    min_raise_amount = self.current_bet + self.big_blind
-                    if action.amount < min_raise_amount:
-                        action.amount = min_raise_amount
+            elif action.action_type in (_BET, _RAISE):
+                # Minimum bet/raise sizes were already enforced by validate_action
 
                 # Calculate how much more the player needs to put in
                 # Consider what they've already put in this round
@@ -475,13 +579,14 @@ class Game:
                 total_amount = players[current_idx].current_bet + additional_amount
 
                 # Log for debugging
-                self.logger.debug(
-                    f"{players[current_idx].name} is adding ${additional_amount} more (total: ${total_amount})"
-                )
+                if self.logger.is_enabled():
+                    self.logger.debug(
+                        f"{players[current_idx].name} is adding ${additional_amount} more (total: ${total_amount})"
+                    )
 
                 # If the total amount is more than they have, go all-in
                 if additional_amount >= players[current_idx].chips:
-                    action.action_type = ActionType.ALL_IN
+                    action.action_type = _ALL_IN
                     action.amount = (
                         players[current_idx].current_bet + players[current_idx].chips
                     )
@@ -491,9 +596,6 @@ class Game:
                     self.pot += players[current_idx].chips
                     players[current_idx].chips = 0
 
-                    # Update statistics
-                    self.stats["all_ins"] += 1
-
                     # If this all-in raises the current bet, this player becomes the last raiser
                     if players[current_idx].current_bet > self.current_bet:
                         self.current_bet = players[current_idx].current_bet
@@ -515,12 +617,6 @@ class Game:
                     # Update the action with the correct amount
                     action.amount = total_amount
 
-                    # Update statistics
-                    if action.action_type == ActionType.BET:
-                        self.stats["bets"] += 1
-                    else:  # RAISE
-                        self.stats["raises"] += 1
-
                     # This player is now the last raiser
                     last_raiser = current_idx
                     # Reset the acted_since_last_raise set since there's a new bet to respond to
@@ -528,7 +624,7 @@ class Game:
 
                     self.logger.log_action(action)
 
-            elif action.action_type == ActionType.ALL_IN:
+            elif action.action_type is _ALL_IN:
                 # Player is going all-in
                 all_in_amount = players[current_idx].chips
 
@@ -543,9 +639,10 @@ class Game:
                 self.pot += additional_amount
 
                 # Log the actual additional amount added to pot
-                self.logger.debug(
-                    f"Adding ${additional_amount} to pot from {players[current_idx].name}'s all-in"
-                )
+                if self.logger.is_enabled():
+                    self.logger.debug(
+                        f"Adding ${additional_amount} to pot from {players[current_idx].name}'s all-in"
+                    )
 
                 # Update player state
                 original_current_bet = players[current_idx].current_bet
@@ -567,11 +664,18 @@ class Game:
 
                 self.logger.log_action(action)
 
+            # Update statistics for the action as it was finally processed
+            stat_key = ACTION_STAT_KEYS.get(action.action_type)
+            if stat_key is not None:
+                self.stats[stat_key] += 1
+            if self.retain_actions:
+                self.actions_taken.append(action)
+
             # Log the updated game state after each action
             self.logger.log_game_state(self.pot, self.community_cards, self.current_bet)
 
             # Move to the next player
-            current_idx = (current_idx + 1) % len(players)
+            current_idx = next_seat[current_idx]
 
             # Check if betting round is complete
 
@@ -602,16 +706,20 @@ class Game:
             if player.chips == 0 and not player.folded:
                 player.folded = False
 
-        # Calculate chip changes for this round
-        ending_chips = {player.name: player.chips for player in players}
+        # Validate chip accounting for this round
+        ending_total_chips = sum(player.chips for player in players) + self.pot
+        accounting_error = starting_total_chips != ending_total_chips
+
+        # Per-player chip changes are only needed for log messages
+        if not accounting_error and not self.logger.is_enabled():
+            return
+
         chip_changes = {
-            name: ending_chips.get(name, 0) - starting_chips.get(name, 0)
-            for name in starting_chips
+            player.name: player.chips - start
+            for player, start in zip(players, starting_chips)
         }
 
-        # Validate chip accounting for this round
-        ending_total_chips = sum(ending_chips.values()) + self.pot
-        if starting_total_chips != ending_total_chips:
+        if accounting_error:
             self.logger.error(
                 f"Chip accounting error in {self.current_round} betting round! "
                 + f"Started with {starting_total_chips}, ended with {ending_total_chips}. "
@@ -631,90 +739,111 @@ class Game:
         self, action: Action, player: Agent, info_set: InformationSet
     ) -> Action:
         """Validate and potentially adjust a player's action based on game rules and player state."""
-        # Create a copy of the action to avoid modifying the original
-        validated_action = copy.deepcopy(action)
+        # Create a copy of the action to avoid modifying the original. A shallow
+        # copy is enough: only the type and amount are rewritten, and the copy
+        # must keep referring to the same player object. Calling the
+        # constructor directly is about ten times faster than copy.copy.
+        validated_action = Action(
+            action.action_type, action.player, action.amount, action.round_name
+        )
+
+        # Folds and checks need no adjustment, and they are the most common
+        # actions, so return before any of the chip checks below
+        action_type = action.action_type
+        if action_type is _FOLD or action_type is _CHECK:
+            return validated_action
+
+        # Hoist attribute reads into locals; each branch below uses them
+        # several times.
+        amount = action.amount
+        name = player.name
+        chips = player.chips
+        player_bet = player.current_bet
+        big_blind = self.big_blind
+        current_bet = info_set.current_bet
 
         # Check if player has enough chips for the action
-        if action.action_type == ActionType.BET:
+        if action_type is _BET:
             # Minimum bet is the big blind
-            min_bet = self.big_blind
-            if action.amount < min_bet:
+            if amount < big_blind:
                 self.logger.warning(
-                    f"Adjusted {player.name}'s BET from ${action.amount} to minimum ${min_bet}"
+                    "Adjusted %s's BET from $%d to minimum $%d", name, amount, big_blind
                 )
-                validated_action.amount = min_bet
+                validated_action.amount = big_blind
 
             # If player doesn't have enough chips, convert to ALL_IN
-            if action.amount > player.chips:
+            if amount > chips:
                 self.logger.warning(
-                    f"Changed {player.name}'s BET to ALL_IN ${player.chips} (insufficient chips)"
+                    "Changed %s's BET to ALL_IN $%d (insufficient chips)", name, chips
                 )
-                validated_action.action_type = ActionType.ALL_IN
-                validated_action.amount = (
-                    player.chips + player.current_bet
-                )  # Total contribution
+                validated_action.action_type = _ALL_IN
+                validated_action.amount = chips + player_bet  # Total contribution
 
-        elif action.action_type == ActionType.RAISE:
+        elif action_type is _RAISE:
             # Minimum raise is current bet + big blind
-            min_raise = info_set.current_bet + self.big_blind
-            if action.amount < min_raise:
+            min_raise = current_bet + big_blind
+            if amount < min_raise:
                 self.logger.warning(
-                    f"Adjusted {player.name}'s RAISE from ${action.amount} to minimum ${min_raise}"
+                    "Adjusted %s's RAISE from $%d to minimum $%d",
+                    name,
+                    amount,
+                    min_raise,
                 )
                 validated_action.amount = min_raise
 
-            # Calculate additional amount needed (considering player's current bet)
-            additional_amount = action.amount - player.current_bet
-
-            # If player doesn't have enough chips, convert to ALL_IN
-            if additional_amount > player.chips:
+            # If player doesn't have enough chips (considering their current
+            # bet), convert to ALL_IN
+            if amount - player_bet > chips:
                 self.logger.warning(
-                    f"Changed {player.name}'s RAISE to ALL_IN ${player.chips} (insufficient chips)"
+                    "Changed %s's RAISE to ALL_IN $%d (insufficient chips)", name, chips
                 )
-                validated_action.action_type = ActionType.ALL_IN
-                validated_action.amount = (
-                    player.chips + player.current_bet
-                )  # Total contribution
+                validated_action.action_type = _ALL_IN
+                validated_action.amount = chips + player_bet  # Total contribution
 
-        elif action.action_type == ActionType.CALL:
+        elif action_type is _CALL:
             # Calculate the amount needed to call
-            call_amount = info_set.current_bet - player.current_bet
+            call_amount = current_bet - player_bet
 
             # If player has 0 chips, adjust call to 0
-            if player.chips == 0:
+            if chips == 0:
                 self.logger.warning(
-                    f"Adjusted {player.name}'s CALL from ${call_amount} to $0"
+                    "Adjusted %s's CALL from $%d to $0", name, call_amount
                 )
                 validated_action.amount = 0
                 return validated_action
 
             # If call amount is 0, it's a check
             if call_amount == 0:
-                validated_action.action_type = ActionType.CHECK
+                validated_action.action_type = _CHECK
                 validated_action.amount = 0
                 return validated_action
 
             # If player doesn't have enough chips, convert to ALL_IN
-            if call_amount > player.chips:
+            if call_amount > chips:
                 self.logger.debug(
-                    f"Call amount needed: ${call_amount}, {player.name} contributing: ${player.chips}"
+                    "Call amount needed: $%d, %s contributing: $%d",
+                    call_amount,
+                    name,
+                    chips,
                 )
                 self.logger.warning(
-                    f"Changed {player.name}'s CALL to ALL_IN ${player.chips} (insufficient chips)"
+                    "Changed %s's CALL to ALL_IN $%d (insufficient chips)", name, chips
                 )
-                validated_action.action_type = ActionType.ALL_IN
-                validated_action.amount = (
-                    player.chips + player.current_bet
-                )  # Total contribution
+                validated_action.action_type = _ALL_IN
+                validated_action.amount = chips + player_bet  # Total contribution
             else:
                 # Set the call amount to the current bet
-                validated_action.amount = info_set.current_bet
+                validated_action.amount = current_bet
 
-        elif action.action_type == ActionType.ALL_IN:
+        elif action_type is _ALL_IN:
             # Set the all-in amount to the player's chips + current bet (total contribution)
-            validated_action.amount = player.chips + player.current_bet
+            validated_action.amount = chips + player_bet
             self.logger.debug(
-                f"{player.name} going ALL_IN with ${player.chips} chips + ${player.current_bet} current bet = ${validated_action.amount} total"
+                "%s going ALL_IN with $%d chips + $%d current bet = $%d total",
+                name,
+                chips,
+                player_bet,
+                validated_action.amount,
             )
 
         return validated_action
@@ -732,12 +861,14 @@ class Game:
 
         active_players: List[Agent] = [p for p in players if not p.folded]
 
-        # Evaluate each player's hand
-        player_hands: List[Tuple[Agent, str, Tuple[int, List[int]]]] = []
-        for player in active_players:
-            hand_score = HandEvaluator.evaluate(player.hand, self.community_cards)
-            hand_type = HandEvaluator.hand_type_to_string(hand_score)
-            player_hands.append((player, hand_type, hand_score))
+        # Evaluate every player's hand against the shared board at once
+        hand_scores = HandEvaluator.evaluate_hands(
+            [player.hand for player in active_players], self.community_cards
+        )
+        player_hands: List[Tuple[Agent, str, Tuple[int, List[int]]]] = [
+            (player, HandEvaluator.hand_type_to_string(hand_score), hand_score)
+            for player, hand_score in zip(active_players, hand_scores)
+        ]
 
         # Sort by hand strength
         player_hands.sort(key=lambda x: x[2], reverse=True)
@@ -809,26 +940,16 @@ class Game:
                     [(winner, "Last Player Standing", None)], pot_amount
                 )
 
-    def log_hand_results(self, starting_chips):
+    def log_hand_results(self, starting_chips: List[int]) -> None:
         """Log the results of a hand and update statistics"""
-        # Calculate chip changes
-        ending_chips = {player.name: player.chips for player in self.players}
-
-        # Add any eliminated players with 0 chips
-        for player_name in self.stats["eliminated"]:
-            if (
-                self.stats["eliminated"][player_name]
-                and player_name not in ending_chips
-            ):
-                ending_chips[player_name] = 0
-
-        # Calculate chip changes for this hand
-        chip_changes = {}
-        for name in starting_chips:
-            chip_changes[name] = ending_chips.get(name, 0) - starting_chips.get(name, 0)
+        # Calculate chip changes for this hand, in seat order
+        players = self.players
+        chip_changes = [
+            player.chips - start for player, start in zip(players, starting_chips)
+        ]
 
         # Check for unaccounted chips (could be in the pot if hand ended early)
-        total_chip_change = sum(chip_changes.values())
+        total_chip_change = sum(chip_changes)
         if total_chip_change != 0 and self.pot > 0:
             self.logger.warning(
                 f"Unaccounted chips: {-total_chip_change}, pot: {self.pot}"
@@ -837,27 +958,24 @@ class Game:
             # If we have a pot that wasn't awarded, we need to distribute it
             # This can happen if the hand ended early
             if self.pot > 0:
-                active_players = [p for p in self.players if not p.folded]
-                if active_players:
+                active_seats = [i for i, p in enumerate(players) if not p.folded]
+                if active_seats:
                     # Award the pot to active players
-                    pot_per_player = self.pot // len(active_players)
-                    remainder = self.pot % len(active_players)
+                    pot_per_player = self.pot // len(active_seats)
+                    remainder = self.pot % len(active_seats)
 
                     # Track total awarded to verify all pot is distributed
                     total_awarded = 0
 
-                    for i, player in enumerate(active_players):
+                    for i, seat in enumerate(active_seats):
                         award = pot_per_player
                         if i < remainder:  # Distribute remainder evenly
                             award += 1
 
+                        player = players[seat]
                         player.chips += award
                         total_awarded += award
-                        chip_changes[player.name] = (
-                            ending_chips.get(player.name, 0)
-                            + award
-                            - starting_chips.get(player.name, 0)
-                        )
+                        chip_changes[seat] += award
 
                         # Log the pot distribution
                         self.logger.info(
@@ -870,12 +988,13 @@ class Game:
                             f"Pot distribution error! Pot: {self.pot}, Awarded: {total_awarded}"
                         )
                         # Fix by giving remainder to first player
-                        if total_awarded < self.pot and active_players:
+                        if total_awarded < self.pot:
                             remainder = self.pot - total_awarded
-                            active_players[0].chips += remainder
-                            chip_changes[active_players[0].name] += remainder
+                            first_player = players[active_seats[0]]
+                            first_player.chips += remainder
+                            chip_changes[active_seats[0]] += remainder
                             self.logger.info(
-                                f"Distributing remainder {remainder} to {active_players[0].name}"
+                                f"Distributing remainder {remainder} to {first_player.name}"
                             )
 
                 # Clear the pot
@@ -896,31 +1015,39 @@ class Game:
             )
 
         # Log the results
-        self.logger.info(f"Hand #{self.hand_counter} complete")
-        self.logger.info(f"Pot: ${self.pot}")
-        self.logger.info(f"Chip changes: {chip_changes}")
-
-        # Update final chips for statistics
-        self.stats["final_chips"] = ending_chips
-
-        # Update eliminated status for players
-        for name in self.stats["eliminated"]:
-            if name not in ending_chips or ending_chips[name] == 0:
-                self.stats["eliminated"][name] = True
-
-        # Determine winner(s)
-        winners = [name for name, change in chip_changes.items() if change > 0]
-        for winner in winners:
-            if (
-                winner in self.stats["player_wins"]
-            ):  # Only update for players still in the game
-                self.stats["player_wins"][winner] += 1
+        if self.logger.is_enabled():
+            changes_by_name = {
+                player.name: change for player, change in zip(players, chip_changes)
+            }
+            self.logger.info(f"Hand #{self.hand_counter} complete")
+            self.logger.info(f"Pot: ${self.pot}")
+            self.logger.info(f"Chip changes: {changes_by_name}")
+
+        # Update final chips and eliminated status in place. Players removed
+        # from the table already had their final 0 chips recorded here.
+        final_chips = self.stats["final_chips"]
+        eliminated = self.stats["eliminated"]
+        for player in players:
+            final_chips[player.name] = player.chips
+            if player.chips == 0:
+                eliminated[player.name] = True
+
+        # Determine winner(s) in a single pass over the seats
+        player_wins = self.stats["player_wins"]
+        for player, change in zip(players, chip_changes):
+            # Only update for players still in the game
+            if change > 0 and player.name in player_wins:
+                player_wins[player.name] += 1
 
         # Update biggest pot statistic
         if self.pot > self.stats["biggest_pot"]:
             self.stats["biggest_pot"] = self.pot
 
-        self.logger.info("")  # Empty line for readability
+        if self.logger.is_enabled():
+            self.logger.info("")  # Empty line for readability
+
+        # Write out anything the logger buffered during the hand
+        self.logger.flush()
 
     def print_stats(self):
         """Print game statistics"""
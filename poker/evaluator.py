@@ -1,17 +1,316 @@
-from collections import Counter
-from typing import List, Optional, Tuple
+from itertools import combinations
+from typing import Dict, Iterable, List, Sequence, Tuple
 
-from poker.models import Card, Rank, Suit
+import numpy as np
+
+from poker.evaluator_tables import (
+    CLASS_SCORES,
+    FLUSH7_LOOKUP,
+    MASK_CARD_INTS,
+    NUM_CLASSES,
+    PRODUCT_LOOKUP,
+    RANK_MASK_PRODUCTS,
+    STRAIGHT_LOOKUP,
+    UNIQUE5_LOOKUP,
+)
+from poker.models import Card
+
+# Best class of a flushless 5-7 card hand, keyed by the product of its rank
+# primes. Only the ranks matter without a flush, so each of the ~50k rank
+# multisets is scored once, the first time it is seen. The product ignores
+# card order and the split between hole and community cards, so callers
+# don't need a cache of their own.
+_UNSUITED_CLASSES: Dict[int, int] = {}
+
+
+def _best_unsuited_class(card_ints: List[int]) -> int:
+    # Seven cards with five distinct ranks can't also hold quads or a full
+    # house, so without a flush a straight is the best hand available
+    rank_bits = 0
+    for ck in card_ints:
+        rank_bits |= ck
+    hand_class = STRAIGHT_LOOKUP[rank_bits >> 16]
+    if hand_class:
+        return hand_class
+
+    best = NUM_CLASSES
+    for a, b, c, d, e in combinations(card_ints, 5):
+        hand_class = UNIQUE5_LOOKUP[(a | b | c | d | e) >> 16] or PRODUCT_LOOKUP[
+            (a & 0xFF) * (b & 0xFF) * (c & 0xFF) * (d & 0xFF) * (e & 0xFF)
+        ]
+        if hand_class < best:
+            best = hand_class
+    return best
+
+
+def evaluate_mask(
+    mask: int,
+    _flush7: List[int] = FLUSH7_LOOKUP,
+    _products: List[int] = RANK_MASK_PRODUCTS,
+    _unsuited: Dict[int, int] = _UNSUITED_CLASSES,
+) -> int:
+    """
+    Find the hand class of 5 to 7 cards given as a 52-bit mask.
+
+    Each suit's rank bits come straight out of the mask, so a flush is four
+    table reads and the unsuited cache key is the product of four more.
+
+    Args:
+        mask: OR of 1 << Card.id over the cards
+
+    Returns:
+        The hand's class, from 1 (royal flush) to 7462 (worst high card)
+    """
+    suit0 = mask & 0x1FFF
+    suit1 = (mask >> 13) & 0x1FFF
+    suit2 = (mask >> 26) & 0x1FFF
+    suit3 = mask >> 39
+
+    # With at most 7 cards, a flush leaves too few other cards for quads
+    # or a full house, so the best flush (or straight flush) wins outright
+    hand_class = _flush7[suit0] or _flush7[suit1] or _flush7[suit2] or _flush7[suit3]
+    if hand_class:
+        return hand_class
+
+    product = _products[suit0] * _products[suit1] * _products[suit2] * _products[suit3]
+    hand_class = _unsuited.get(product)
+    if hand_class is None:
+        card_ints = [MASK_CARD_INTS[bit] for bit in range(52) if mask >> bit & 1]
+        hand_class = _unsuited[product] = _best_unsuited_class(card_ints)
+    return hand_class
+
+
+# Name of each hand category, indexed by category
+_HAND_NAMES: Tuple[str, ...] = (
+    "High Card",
+    "Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+    "Royal Flush",
+)
+
+# Lookup tables for evaluate_batch: the flush table as an array, and the
+# category and packed kickers of each hand class. Kickers are packed four bits
+# each, first kicker highest, so (category, kickers) pairs order hands the
+# same way HandEvaluator's scores do.
+_FLUSH7_ARRAY = np.array(FLUSH7_LOOKUP, dtype=np.int64)
+_SUIT_LANE_SHIFTS = np.zeros(16, dtype=np.int64)
+_SUIT_LANE_SHIFTS[[1, 2, 4, 8]] = (0, 13, 26, 39)
+_CLASS_CATEGORIES = np.array(
+    [category for category, _ in CLASS_SCORES], dtype=np.uint8
+)
+_CLASS_KICKERS = np.array(
+    [
+        sum(kicker << (16 - 4 * i) for i, kicker in enumerate(kickers))
+        for _, kickers in CLASS_SCORES
+    ],
+    dtype=np.uint32,
+)
+
+
+# Sorted array copy of _UNSUITED_CLASSES as (products, classes), so batches
+# of hands seen before are looked up without a Python loop. It starts with a
+# 0 product that matches no hand.
+_UNSUITED_ARRAYS: List[np.ndarray] = [
+    np.zeros(1, dtype=np.int64),
+    np.zeros(1, dtype=np.int64),
+]
+
+
+def _refresh_unsuited_arrays() -> List[np.ndarray]:
+    count = len(_UNSUITED_CLASSES)
+    keys = np.fromiter(_UNSUITED_CLASSES.keys(), dtype=np.int64, count=count)
+    values = np.fromiter(_UNSUITED_CLASSES.values(), dtype=np.int64, count=count)
+    order = np.argsort(keys)
+    _UNSUITED_ARRAYS[:] = keys[order], values[order]
+    return _UNSUITED_ARRAYS
+
+
+def evaluate_batch(card_ints: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate many hands of 5 to 7 Cactus-Kev encoded cards at once.
+
+    Flushes are found with array operations over the whole batch. Hands
+    without a flush are looked up by rank-prime product in a sorted copy of
+    the _UNSUITED_CLASSES cache evaluate_mask fills; only rank multisets it
+    hasn't seen are scored in Python, once each.
+
+    Args:
+        card_ints: Array of shape (N, 5 to 7), one encoded hand per row
+
+    Returns:
+        The hands' categories (uint8, 0-9) and packed kickers (uint32)
+    """
+    classes = _batch_classes(card_ints)
+    return _CLASS_CATEGORIES[classes], _CLASS_KICKERS[classes]
+
+
+def _batch_classes(card_ints: np.ndarray) -> np.ndarray:
+    card_ints = np.asarray(card_ints, dtype=np.int64)
+    if card_ints.ndim != 2 or not 5 <= card_ints.shape[1] <= 7:
+        raise ValueError("Hands are evaluated from 5 to 7 cards")
+
+    # Give each suit its own 13-bit lane so one OR over the cards collects
+    # every suit's rank bits. At most one suit can hold five of seven cards,
+    # so the per-suit flush classes can simply be summed.
+    lanes = np.bitwise_or.reduce(
+        (card_ints >> 16) << _SUIT_LANE_SHIFTS[(card_ints >> 12) & 0xF], axis=1
+    )
+    classes = _FLUSH7_ARRAY[lanes & 0x1FFF]
+    for shift in (13, 26, 39):
+        classes += _FLUSH7_ARRAY[(lanes >> shift) & 0x1FFF]
+
+    unsuited = classes == 0
+    if unsuited.any():
+        hands = card_ints[unsuited]
+        products = np.prod(hands & 0xFF, axis=1)
+        keys, values = _UNSUITED_ARRAYS
+        positions = np.minimum(np.searchsorted(keys, products), len(keys) - 1)
+        missing = keys[positions] != products
+        if missing.any():
+            # Score the rank multisets the arrays don't hold yet, once each
+            missing_hands = hands[missing]
+            distinct, first = np.unique(products[missing], return_index=True)
+            for product, row in zip(distinct.tolist(), first.tolist()):
+                if product not in _UNSUITED_CLASSES:
+                    _UNSUITED_CLASSES[product] = _best_unsuited_class(
+                        missing_hands[row].tolist()
+                    )
+            keys, values = _refresh_unsuited_arrays()
+            positions = np.searchsorted(keys, products)
+        classes[unsuited] = values[positions]
+
+    return classes
 
 
 class HandEvaluator:
     @staticmethod
     def evaluate(
-        hand: List[Card], community_cards: List[Card]
+        hand: Sequence[Card], community_cards: Sequence[Card]
     ) -> Tuple[int, List[int]]:
-        all_cards = hand + community_cards
+        # Either argument may be a tuple or a list
+        all_cards = [*hand, *community_cards]
         return HandEvaluator._get_best_hand(all_cards)
 
+    @staticmethod
+    def evaluate_hands(
+        hands: List[Sequence[Card]], community_cards: Sequence[Card]
+    ) -> List[Tuple[int, List[int]]]:
+        """
+        Score several players' hole cards against the same community cards.
+
+        The community cards are combined once and shared by every hand. For
+        a table's worth of players this is faster than evaluate_batch, whose
+        numpy overhead only pays off over many hands.
+
+        Args:
+            hands: Each player's hole cards
+            community_cards: The shared board
+
+        Returns:
+            Each hand's score, as HandEvaluator.evaluate reports it
+        """
+        board_mask = 0
+        for card in community_cards:
+            board_mask |= card._mask
+
+        scores = []
+        for hand in hands:
+            if not 5 <= len(hand) + len(community_cards) <= 7:
+                raise ValueError("Hands are evaluated from 5 to 7 cards")
+            mask = board_mask
+            for card in hand:
+                mask |= card._mask
+            category, kickers = CLASS_SCORES[evaluate_mask(mask)]
+            scores.append((category, list(kickers)))
+        return scores
+
+    @staticmethod
+    def compare_two(
+        hand1: Sequence[Card], hand2: Sequence[Card], community_cards: Sequence[Card]
+    ) -> int:
+        """
+        Compare two players' hole cards against the same community cards.
+
+        Hand classes order hands exactly as their scores do, so this skips
+        building the scores.
+
+        Args:
+            hand1: The first player's hole cards
+            hand2: The second player's hole cards
+            community_cards: The shared board
+
+        Returns:
+            1 if the first hand wins, -1 if the second does, 0 for a split
+        """
+        num_cards = len(hand1) + len(community_cards)
+        if len(hand2) != len(hand1) or not 5 <= num_cards <= 7:
+            raise ValueError("Hands are evaluated from 5 to 7 cards")
+        board_mask = 0
+        for card in community_cards:
+            board_mask |= card._mask
+        mask1 = mask2 = board_mask
+        for card in hand1:
+            mask1 |= card._mask
+        for card in hand2:
+            mask2 |= card._mask
+
+        # Lower classes are better hands
+        class1 = evaluate_mask(mask1)
+        class2 = evaluate_mask(mask2)
+        return (class1 < class2) - (class1 > class2)
+
+    @staticmethod
+    def evaluate_ids(card_ids: Iterable[int]) -> Tuple[int, List[int]]:
+        """
+        Score a hand of 5 to 7 cards given by their ids.
+
+        Args:
+            card_ids: Distinct card ids, see Card.id
+
+        Returns:
+            The hand's score, as HandEvaluator.evaluate reports it
+        """
+        mask = 0
+        count = 0
+        for card_id in card_ids:
+            card_id = int(card_id)
+            if not 0 <= card_id < 52:
+                raise ValueError(f"Card ids run from 0 to 51, got {card_id}")
+            mask |= 1 << card_id
+            count += 1
+        if not 5 <= count <= 7:
+            raise ValueError("Hands are evaluated from 5 to 7 cards")
+        if mask.bit_count() != count:
+            raise ValueError("A hand cannot hold the same card twice")
+        category, kickers = CLASS_SCORES[evaluate_mask(mask)]
+        return (category, list(kickers))
+
+    @staticmethod
+    def score_hands(hands: List[List[Card]]) -> List[Tuple[int, List[int]]]:
+        """
+        Score several hands of 5 to 7 cards with one vectorized evaluation.
+
+        Unlike the module-level evaluate_batch, this takes Card hands and
+        returns HandEvaluator scores rather than arrays.
+
+        Args:
+            hands: The cards of each hand; every hand has the same count
+
+        Returns:
+            Each hand's score, as HandEvaluator.evaluate reports it
+        """
+        if not hands:
+            return []
+        classes = _batch_classes([[card._ck for card in hand] for hand in hands])
+        scores = [CLASS_SCORES[hand_class] for hand_class in classes.tolist()]
+        return [(category, list(kickers)) for category, kickers in scores]
+
     @staticmethod
     def _get_best_hand(cards: List[Card]) -> Tuple[int, List[int]]:
         # Score the hand (higher is better)
@@ -25,164 +324,19 @@ class HandEvaluator:
         # 8. Two Pair (2)
         # 9. Pair (1)
         # 10. High Card (0)
+        if not 5 <= len(cards) <= 7:
+            raise ValueError("Hands are evaluated from 5 to 7 cards")
 
-        # Check for flush
-        suits: List[Suit] = [card.suit for card in cards]
-        suit_counter = Counter(suits)
-        flush_suit: Optional[Suit] = next(
-            (suit for suit, count in suit_counter.items() if count >= 5), None
-        )
-
-        # Count ranks
-        ranks: List[Rank] = [card.rank for card in cards]
-        rank_counter = Counter(ranks)
-
-        # Check for straight
-        rank_values: List[int] = sorted([r.value for r in ranks])
-        unique_values: List[int] = sorted(set(rank_values))
-        straight: bool = False
-        straight_high: Optional[int] = None
-
-        # Special case for A-5 straight
-        if (
-            Rank.ACE in ranks
-            and Rank.TWO in ranks
-            and Rank.THREE in ranks
-            and Rank.FOUR in ranks
-            and Rank.FIVE in ranks
-        ):
-            straight = True
-            straight_high = 5
-
-        # Normal straights
-        for i in range(len(unique_values) - 4):
-            if unique_values[i : i + 5] == list(
-                range(unique_values[i], unique_values[i] + 5)
-            ):
-                straight = True
-                straight_high = unique_values[i + 4]
-
-        # Check for straight flush
-        straight_flush: bool = False
-        if flush_suit and straight:
-            flush_cards: List[Card] = [
-                card for card in cards if card.suit == flush_suit
-            ]
-            flush_values: List[int] = sorted([card.rank.value for card in flush_cards])
-
-            # Check for regular straight in flush cards
-            for i in range(len(flush_values) - 4):
-                if flush_values[i : i + 5] == list(
-                    range(flush_values[i], flush_values[i] + 5)
-                ):
-                    straight_flush = True
-                    straight_high = flush_values[i + 4]
-                    break
-
-            # Check for A-5 straight flush
-            if (
-                Rank.ACE.value in flush_values
-                and Rank.TWO.value in flush_values
-                and Rank.THREE.value in flush_values
-                and Rank.FOUR.value in flush_values
-                and Rank.FIVE.value in flush_values
-            ):
-                straight_flush = True
-                straight_high = 5
-
-        # Royal flush
-        royal_flush: bool = straight_flush and straight_high == Rank.ACE.value
-
-        # Four of a kind
-        four_kind: bool = any(count == 4 for count in rank_counter.values())
-
-        # Full house
-        three_kind: bool = any(count == 3 for count in rank_counter.values())
-        pairs: List[Rank] = [rank for rank, count in rank_counter.items() if count == 2]
-        full_house: bool = three_kind and pairs
-
-        # Flush (already checked above with flush_suit)
-
-        # Three of a kind (already checked)
-
-        # Two pair
-        two_pair: bool = len(pairs) >= 2
-
-        # Pair
-        pair: bool = len(pairs) == 1
-
-        # Determine hand type and score
-        if royal_flush:
-            return (9, [Rank.ACE.value])
-        elif straight_flush:
-            return (8, [straight_high])
-        elif four_kind:
-            quads: Rank = next(
-                rank for rank, count in rank_counter.items() if count == 4
-            )
-            kicker: Rank = max([r for r in ranks if r != quads], key=lambda x: x.value)
-            return (7, [quads.value, kicker.value])
-        elif full_house:
-            trips: Rank = next(
-                rank for rank, count in rank_counter.items() if count == 3
-            )
-            pair_rank: Rank = next(
-                rank for rank, count in rank_counter.items() if count == 2
-            )
-            return (6, [trips.value, pair_rank.value])
-        elif flush_suit:
-            flush_values: List[int] = [
-                card.rank.value for card in cards if card.suit == flush_suit
-            ]
-            return (5, sorted(flush_values, reverse=True)[:5])
-        elif straight:
-            return (4, [straight_high])
-        elif three_kind:
-            trips: Rank = next(
-                rank for rank, count in rank_counter.items() if count == 3
-            )
-            kickers: List[int] = sorted(
-                [r.value for r in ranks if r != trips], reverse=True
-            )[:2]
-            return (3, [trips.value] + kickers)
-        elif two_pair:
-            top_pairs: List[Rank] = sorted(pairs, key=lambda x: x.value, reverse=True)[
-                :2
-            ]
-            kicker: Rank = max(
-                [r for r in ranks if r not in top_pairs], key=lambda x: x.value
-            )
-            return (2, [p.value for p in top_pairs] + [kicker.value])
-        elif pair:
-            pair_rank: Rank = pairs[0]
-            kickers: List[int] = sorted(
-                [r.value for r in ranks if r != pair_rank], reverse=True
-            )[:3]
-            return (1, [pair_rank.value] + kickers)
-        else:
-            high_cards: List[int] = sorted([r.value for r in ranks], reverse=True)[:5]
-            return (0, high_cards)
+        mask = 0
+        for card in cards:
+            mask |= card._mask
+        # A repeated card would be silently dropped from the mask
+        if mask.bit_count() != len(cards):
+            raise ValueError("A hand cannot hold the same card twice")
+        hand_class = evaluate_mask(mask)
+        category, kickers = CLASS_SCORES[hand_class]
+        return (category, list(kickers))
 
     @staticmethod
     def hand_type_to_string(hand_score: Tuple[int, List[int]]) -> str:
-        hand_type: int = hand_score[0]
-        if hand_type == 9:
-            return "Royal Flush"
-        elif hand_type == 8:
-            return "Straight Flush"
-        elif hand_type == 7:
-            return "Four of a Kind"
-        elif hand_type == 6:
-            return "Full House"
-        elif hand_type == 5:
-            return "Flush"
-        elif hand_type == 4:
-            return "Straight"
-        elif hand_type == 3:
-            return "Three of a Kind"
-        elif hand_type == 2:
-            return "Two Pair"
-        elif hand_type == 1:
-            return "Pair"
-        else:
-            return "High Card"
+        return _HAND_NAMES[hand_score[0]]
@@ -0,0 +1,194 @@
+"""
+Lookup tables for the Cactus-Kev hand evaluator.
+
+Every card is encoded as a 32-bit int:
+
+    xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+
+where ``b`` is a bit for the card's rank, ``cdhs`` is a bit for its suit,
+``r`` is the rank index (0 = deuce, 12 = ace) and ``p`` is the rank's prime.
+Each of the 7462 distinct five-card poker hands is given an equivalence
+class, 1 (royal flush) being the best and 7462 (7-5-4-3-2 offsuit) the worst.
+The tables are built once, when this module is first imported. That takes
+around ten milliseconds, so they are not cached on disk.
+"""
+
+from itertools import combinations
+from typing import Dict, List, Tuple
+
+from poker.models import RANK_PRIMES, Card, Rank, Suit
+
+# A product of rank primes identifies a multiset of ranks regardless of order
+PRIMES: Tuple[int, ...] = RANK_PRIMES
+
+# Hand categories, as reported by HandEvaluator
+(
+    HIGH_CARD,
+    PAIR,
+    TWO_PAIR,
+    THREE_OF_A_KIND,
+    STRAIGHT,
+    FLUSH,
+    FULL_HOUSE,
+    FOUR_OF_A_KIND,
+    STRAIGHT_FLUSH,
+    ROYAL_FLUSH,
+) = range(10)
+
+# Number of distinct five-card hand classes
+NUM_CLASSES = 7462
+
+# Rank-bit masks of the ten straights with their high card, best first
+STRAIGHTS: Tuple[Tuple[int, int], ...] = tuple(
+    (0b11111 << low, low + 6) for low in range(8, -1, -1)
+) + ((0b1000000001111, 5),)  # The wheel: A-2-3-4-5 plays five high
+
+
+def card_int(rank: Rank, suit: Suit) -> int:
+    """Encode a card in the Cactus-Kev format."""
+    return Card(rank, suit)._ck
+
+
+# Encoded card for each bit position of a 52-bit hand mask. Each suit has 13
+# rank bits (deuce lowest), suits in Suit order, so a suit's ranks can be
+# shifted straight out of the mask; a card's bit is 1 << Card.id.
+MASK_CARD_INTS: Tuple[int, ...] = tuple(
+    card_int(rank, suit) for suit in Suit for rank in Rank
+)
+
+
+def _build_tables() -> Tuple[
+    List[int], List[int], Dict[int, int], List[Tuple[int, Tuple[int, ...]]]
+]:
+    # Classes are handed out in order of decreasing strength; within a
+    # category the ranks are walked from high to low so the class order
+    # matches the kicker order
+    class_scores: List[Tuple[int, Tuple[int, ...]]] = [(HIGH_CARD, ())]
+    flushes = [0] * 8192
+    unique5 = [0] * 8192
+    products: Dict[int, int] = {}
+
+    def add(category: int, ranks: Tuple[int, ...]) -> int:
+        class_scores.append((category, tuple(r + 2 for r in ranks)))
+        return len(class_scores) - 1
+
+    ranks_desc = range(12, -1, -1)
+    straight_masks = {mask for mask, _ in STRAIGHTS}
+    # Five distinct ranks that don't form a straight: flushes and high cards
+    distinct: List[Tuple[int, Tuple[int, ...]]] = []
+    for combo in combinations(ranks_desc, 5):
+        mask = sum(1 << r for r in combo)
+        if mask not in straight_masks:
+            distinct.append((mask, combo))
+
+    for mask, high in STRAIGHTS:
+        category = ROYAL_FLUSH if high == 14 else STRAIGHT_FLUSH
+        flushes[mask] = add(category, (high - 2,))
+
+    for quads in ranks_desc:
+        for kicker in ranks_desc:
+            if kicker != quads:
+                product = PRIMES[quads] ** 4 * PRIMES[kicker]
+                products[product] = add(FOUR_OF_A_KIND, (quads, kicker))
+
+    for trips in ranks_desc:
+        for pair in ranks_desc:
+            if pair != trips:
+                product = PRIMES[trips] ** 3 * PRIMES[pair] ** 2
+                products[product] = add(FULL_HOUSE, (trips, pair))
+
+    for mask, combo in distinct:
+        flushes[mask] = add(FLUSH, combo)
+
+    for mask, high in STRAIGHTS:
+        unique5[mask] = add(STRAIGHT, (high - 2,))
+
+    for trips in ranks_desc:
+        others = [r for r in ranks_desc if r != trips]
+        for k1, k2 in combinations(others, 2):
+            product = PRIMES[trips] ** 3 * PRIMES[k1] * PRIMES[k2]
+            products[product] = add(THREE_OF_A_KIND, (trips, k1, k2))
+
+    for high_pair, low_pair in combinations(ranks_desc, 2):
+        for kicker in ranks_desc:
+            if kicker != high_pair and kicker != low_pair:
+                product = (
+                    PRIMES[high_pair] ** 2 * PRIMES[low_pair] ** 2 * PRIMES[kicker]
+                )
+                products[product] = add(TWO_PAIR, (high_pair, low_pair, kicker))
+
+    for pair in ranks_desc:
+        others = [r for r in ranks_desc if r != pair]
+        for k1, k2, k3 in combinations(others, 3):
+            product = PRIMES[pair] ** 2 * PRIMES[k1] * PRIMES[k2] * PRIMES[k3]
+            products[product] = add(PAIR, (pair, k1, k2, k3))
+
+    for mask, combo in distinct:
+        unique5[mask] = add(HIGH_CARD, combo)
+
+    assert len(class_scores) == NUM_CLASSES + 1
+    return flushes, unique5, products, class_scores
+
+
+def _build_flush7(flushes: List[int]) -> List[int]:
+    # Extend the five-card flush table to six and seven suited cards: the
+    # best class of a mask is the best over the masks with one bit removed.
+    # Walking masks in increasing order visits every sub-mask first.
+    flush7 = flushes[:]
+    for mask in range(8192):
+        if 5 < bin(mask).count("1") <= 7:
+            best = NUM_CLASSES
+            bits = mask
+            while bits:
+                low = bits & -bits
+                hand_class = flush7[mask ^ low]
+                if hand_class < best:
+                    best = hand_class
+                bits ^= low
+            flush7[mask] = best
+    return flush7
+
+
+def _build_straights(unique5: List[int]) -> List[int]:
+    # Mark every superset of each straight's mask, best straight last so it
+    # overwrites the weaker straights it contains
+    straights = [0] * 8192
+    for mask, _ in reversed(STRAIGHTS):
+        hand_class = unique5[mask]
+        free = 0x1FFF ^ mask
+        extra = free
+        while True:
+            straights[mask | extra] = hand_class
+            if not extra:
+                break
+            extra = (extra - 1) & free
+    return straights
+
+
+def _build_rank_products() -> List[int]:
+    # Each mask's product is its lowest rank's prime times the product of
+    # the mask without that rank, which is smaller and so already filled in
+    products = [1] * 8192
+    for mask in range(1, 8192):
+        low = mask & -mask
+        products[mask] = products[mask ^ low] * PRIMES[low.bit_length() - 1]
+    return products
+
+
+# FLUSH_LOOKUP and UNIQUE5_LOOKUP are indexed by the OR of the five cards'
+# rank bits (bits 16-28 shifted down); 0 means "not in this table".
+# PRODUCT_LOOKUP is keyed by the product of the five rank primes and covers
+# every hand with a repeated rank. CLASS_SCORES maps a class back to the
+# (category, kickers) score HandEvaluator reports.
+FLUSH_LOOKUP, UNIQUE5_LOOKUP, PRODUCT_LOOKUP, CLASS_SCORES = _build_tables()
+
+# Best class for five to seven cards of one suit, indexed by their rank bits;
+# 0 for fewer than five cards
+FLUSH7_LOOKUP = _build_flush7(FLUSH_LOOKUP)
+
+# Class of the best straight among any number of ranks, indexed by their rank
+# bits; 0 if they hold no straight
+STRAIGHT_LOOKUP = _build_straights(UNIQUE5_LOOKUP)
+
+# Product of the rank primes of each set of ranks, indexed by their rank bits
+RANK_MASK_PRODUCTS = _build_rank_products()
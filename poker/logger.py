@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Optional, TextIO, Tuple, TypeVar
 
 from colorama import Fore, Style, init
 
+from poker.models import ACTION_TYPE_NAMES
+
 # Initialize colorama
 init(autoreset=True)
 
@@ -23,62 +25,123 @@ class ConsoleLogger:
     with appropriate colors and formatting. It also supports writing logs to a file.
     """
 
-    # Color mapping for different elements
+    # Color mapping for different elements (bright colors use a single merged
+    # SGR sequence rather than a color code followed by a separate bold code)
     COLORS = {
         "INFO": Fore.WHITE,
         "WARNING": Fore.YELLOW,
         "ERROR": Fore.RED,
-        "FATAL": Fore.RED + Style.BRIGHT,
+        "FATAL": "\x1b[31;1m",
         "DEBUG": Fore.CYAN,
-        "SUCCESS": Fore.GREEN + Style.BRIGHT,
+        "SUCCESS": "\x1b[32;1m",
+    }
+
+    # Colored "[LEVEL]" prefix for each level, built once
+    PREFIXES = {
+        level: f"{color}[{level}]{Style.RESET_ALL}" for level, color in COLORS.items()
     }
 
-    def __init__(self, log_to_file: bool = True, verbose: bool = True) -> None:
+    def __init__(
+        self, log_to_file: bool = True, verbose: bool = True, buffered: bool = False
+    ) -> None:
         """
         Initialize the logger.
 
         Args:
             log_to_file: Whether to log to a file
             verbose: Whether to print verbose output to console
+            buffered: Whether to hold log lines in memory until flush() is called
         """
         self.verbose: bool = verbose
+        self.buffered: bool = buffered
         self.log_file: Optional[TextIO] = None
 
+        # Pending console and file lines while buffering
+        self._console_buffer: List[str] = []
+        self._file_buffer: List[str] = []
+
         # Create logs directory if it doesn't exist
         if log_to_file:
             log_dir = "logs"
             os.makedirs(log_dir, exist_ok=True)
 
-            # Set up log file
+            # Set up log file; the process id keeps games started in the same
+            # second by parallel workers from writing to the same file
             self.log_file = open(
                 os.path.join(
                     log_dir,
-                    f"poker_game_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+                    f"poker_game_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                    f"_{os.getpid()}.log",
                 ),
                 "w",
             )
 
-    def _log(self, level: str, message: str) -> None:
+        # True when there is nowhere to send output, so formatting can be skipped
+        self._dropped: bool = not self.verbose and self.log_file is None
+
+    def _log(self, level: str, message: str, args: tuple = ()) -> None:
         """
         Internal logging function that handles both console and file output.
 
         Args:
             level: The log level or category (e.g., INFO, WARNING, ERROR)
-            message: The message to log
+            message: The message to log, a %-format template if args are given
+            args: Values substituted into the message, only if it is written
         """
+        if self._dropped:
+            return
+
+        if args:
+            message = message % args
+
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        color = self.COLORS.get(level, Fore.WHITE)
-        log_line = f"{timestamp} {color}[{level}]{Style.RESET_ALL} {message}"
+        prefix = self.PREFIXES.get(level)
+        if prefix is None:
+            prefix = f"{Fore.WHITE}[{level}]{Style.RESET_ALL}"
+        log_line = f"{timestamp} {prefix} {message}"
+
+        # Strip color codes for file logging
+        plain_log_line = f"{timestamp} [{level}] {message}"
+
+        if self.buffered:
+            if self.verbose:
+                self._console_buffer.append(log_line)
+            if self.log_file:
+                self._file_buffer.append(plain_log_line)
+            return
 
         if self.verbose:
             print(log_line)
 
         if self.log_file:
-            # Strip color codes for file logging
-            plain_log_line = f"{timestamp} [{level}] {message}"
             self.log_file.write(plain_log_line + "\n")
             self.log_file.flush()
 
+    def flush(self) -> None:
+        """
+        Write out any buffered log lines in a single call per destination.
+        """
+        if self._console_buffer:
+            print("\n".join(self._console_buffer))
+            self._console_buffer.clear()
+
+        if self._file_buffer:
+            if self.log_file:
+                self.log_file.write("\n".join(self._file_buffer) + "\n")
+                self.log_file.flush()
+            self._file_buffer.clear()
+
+    def set_buffered(self, buffered: bool) -> None:
+        """
+        Set whether log lines are buffered until flush() is called.
+
+        Args:
+            buffered: Whether to buffer log output
+        """
+        if not buffered:
+            self.flush()
+        self.buffered = buffered
+
     def set_verbose(self, verbose: bool) -> None:
         """
         Set the verbose flag to control console output.
@@ -87,6 +150,16 @@ class ConsoleLogger:
             verbose: Whether to print verbose output to console
         """
         self.verbose = verbose
+        self._dropped = not verbose and self.log_file is None
+
+    def is_enabled(self) -> bool:
+        """
+        Check whether logged messages are written anywhere.
+
+        Returns:
+            False when output is neither printed nor written to a file
+        """
+        return not self._dropped
 
     def _format_cards(self, cards: List[Card]) -> str:
         """
@@ -114,50 +187,55 @@ class ConsoleLogger:
         """
         return f"${amount}"
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: object) -> None:
         """
         Log an info message.
 
         Args:
             message: The message to log
+            *args: Optional %-format arguments for the message
         """
-        self._log("INFO", message)
+        self._log("INFO", message, args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: object) -> None:
         """
         Log a warning message.
 
         Args:
             message: The warning message to log
+            *args: Optional %-format arguments for the message
         """
-        self._log("WARNING", message)
+        self._log("WARNING", message, args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: object) -> None:
         """
         Log an error message.
 
         Args:
             message: The error message to log
+            *args: Optional %-format arguments for the message
         """
-        self._log("ERROR", message)
+        self._log("ERROR", message, args)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: object) -> None:
         """
         Log a debug message.
 
         Args:
             message: The debug message to log
+            *args: Optional %-format arguments for the message
         """
-        self._log("DEBUG", message)
+        self._log("DEBUG", message, args)
 
-    def success(self, message: str) -> None:
+    def success(self, message: str, *args: object) -> None:
         """
         Log a success message.
 
         Args:
             message: The success message to log
+            *args: Optional %-format arguments for the message
         """
-        self._log("SUCCESS", message)
+        self._log("SUCCESS", message, args)
 
     def log_game_start(
         self, num_players: int, starting_chips: int, small_blind: int, big_blind: int
@@ -171,6 +249,9 @@ class ConsoleLogger:
             small_blind: Small blind amount
             big_blind: Big blind amount
         """
+        if self._dropped:
+            return
+
         self.info(f"Starting poker game with {num_players} players")
         self.info(f"Starting chips: {self._format_chips(starting_chips)}")
         self.info(
@@ -184,6 +265,9 @@ class ConsoleLogger:
         Args:
             dealer: The dealer player for this hand
         """
+        if self._dropped:
+            return
+
         self.info("=== Starting New Hand ===")
         self.info(f"Dealer: {dealer.name}")
 
@@ -194,6 +278,9 @@ class ConsoleLogger:
         Args:
             player: The player whose state to log
         """
+        if self._dropped:
+            return
+
         status = "ACTIVE"
         if player.folded:
             status = "FOLDED"
@@ -213,6 +300,9 @@ class ConsoleLogger:
         Args:
             round_name: The name of the round (e.g., Pre-Flop, Flop, Turn, River)
         """
+        if self._dropped:
+            return
+
         self.info(f"=== Starting Round: {round_name} ===")
 
     def log_action(self, action: Action) -> None:
@@ -222,6 +312,9 @@ class ConsoleLogger:
         Args:
             action: The action to log
         """
+        if self._dropped:
+            return
+
         self.success(str(action))
 
     def log_game_state(
@@ -235,6 +328,9 @@ class ConsoleLogger:
             community_cards: The community cards on the table
             current_bet: The current bet amount
         """
+        if self._dropped:
+            return
+
         self.debug(
             f"Pot: {self._format_chips(pot)} | Current bet: {self._format_chips(current_bet)}"
         )
@@ -247,6 +343,9 @@ class ConsoleLogger:
         Args:
             player: The player whose cards to log
         """
+        if self._dropped:
+            return
+
         self.debug(f"{player.name}'s hand: {self._format_cards(player.hand)}")
 
     def log_community_cards(self, new_cards: List[Card], all_cards: List[Card]) -> None:
@@ -257,6 +356,9 @@ class ConsoleLogger:
             new_cards: The newly dealt community cards
             all_cards: All community cards currently on the table
         """
+        if self._dropped:
+            return
+
         self.info(f"Dealing community cards: {self._format_cards(new_cards)}")
         self.info(f"Current board: {self._format_cards(all_cards)}")
 
@@ -271,6 +373,9 @@ class ConsoleLogger:
             pot: The current pot amount
             current_bet: The current bet amount
         """
+        if self._dropped:
+            return
+
         self.info(f"Starting betting round: {round_name}")
         self.info(
             f"Current pot: {self._format_chips(pot)} | Current bet: {self._format_chips(current_bet)}"
@@ -287,6 +392,9 @@ class ConsoleLogger:
             pot: The final pot amount
             chip_changes: Dictionary mapping player names to their chip changes
         """
+        if self._dropped:
+            return
+
         self.info(f"Betting round complete: {round_name}")
         self.info(f"Final pot: {self._format_chips(pot)}")
 
@@ -306,6 +414,9 @@ class ConsoleLogger:
         Args:
             player_hands: List of tuples containing (player, hand_type, hand_value)
         """
+        if self._dropped:
+            return
+
         self.info("=== Showdown ===")
         for player, hand_type, _ in player_hands:
             self.info(f"{player.name}: {self._format_cards(player.hand)} - {hand_type}")
@@ -318,6 +429,9 @@ class ConsoleLogger:
             winner: The winning player
             pot: The pot amount won
         """
+        if self._dropped:
+            return
+
         self.info(f"{winner.name} wins {self._format_chips(pot)}")
 
     def display_simulation_stats(self, stats: Dict[str, Any]) -> None:
@@ -406,35 +520,40 @@ class ConsoleLogger:
 
         # Show player states
         print("\nPlayers:")
+        min_call_amount = info_set.min_call_amount
+        is_showdown = info_set.current_round == "Showdown"
         for name, state in info_set.player_states.items():
+            # Read each field once per player
+            folded = state["folded"]
+            chips = state["chips"]
+            is_active = state["is_active"]
+
             status = ""
-            if state["folded"]:
+            if folded:
                 status = "FOLDED"
-            elif state["chips"] == 0:
+            elif chips == 0:
                 status = "ALL IN"
-            elif state["is_active"]:
-                status = "ACTIVE"
-
+            elif is_active:
                 # For active player, show minimum call amount
-                if info_set.min_call_amount > 0:
-                    status += f" | To call: ${info_set.min_call_amount}"
-                    status += f" | Min raise: ${min_raise_amount}"
+                if min_call_amount > 0:
+                    status = (
+                        f"ACTIVE | To call: ${min_call_amount}"
+                        f" | Min raise: ${min_raise_amount}"
+                    )
                 else:
-                    status += f" | Min bet: ${min_bet_amount}"
+                    status = f"ACTIVE | Min bet: ${min_bet_amount}"
 
             # Show dealer button
             dealer = " (D)" if state["is_dealer"] else ""
 
             # Show player's hand if it's the active player or if it's a showdown
-            hand_str = ""
-            if state["is_active"] or (
-                info_set.current_round == "Showdown" and not state["folded"]
-            ):
-                hand_str = " ".join(str(card) for card in state["hand"])
-                hand_str = f" | Hand: {hand_str}"
+            if is_active or (is_showdown and not folded):
+                hand_str = " | Hand: " + " ".join(str(card) for card in state["hand"])
+            else:
+                hand_str = ""
 
             print(
-                f"  {name}{dealer}: ${state['chips']} | Bet: ${state['current_bet']} {status}{hand_str}"
+                f"  {name}{dealer}: ${chips} | Bet: ${state['current_bet']} {status}{hand_str}"
             )
 
         # Show action history by round (only the most recent actions to keep it concise)
@@ -443,7 +562,7 @@ class ConsoleLogger:
         # Print all actions with their rounds
         for action in info_set.action_history:
             # Format the action text
-            action_text = f"{action.action_type.name}"
+            action_text = ACTION_TYPE_NAMES[action.action_type]
             if action.amount > 0:
                 action_text += f" ${action.amount}"
 
@@ -1,7 +1,10 @@
 import random
 from abc import ABC, abstractmethod
-from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from enum import Enum, IntEnum, auto
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 
 class Suit(Enum):
@@ -11,7 +14,13 @@ class Suit(Enum):
     SPADES = "♠"
 
 
-class Rank(Enum):
+# Display string for each rank, indexed by rank value
+_RANK_STRINGS: Tuple[str, ...] = (
+    "", "", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"
+)
+
+
+class Rank(IntEnum):
     TWO = 2
     THREE = 3
     FOUR = 4
@@ -27,44 +36,111 @@ class Rank(Enum):
     ACE = 14
 
     def __str__(self) -> str:
-        if self.value <= 10:
-            return str(self.value)
-        elif self.value == 11:
-            return "J"
-        elif self.value == 12:
-            return "Q"
-        elif self.value == 13:
-            return "K"
-        else:
-            return "A"
+        return _RANK_STRINGS[self]
+
+    def __format__(self, format_spec: str) -> str:
+        return format(_RANK_STRINGS[self], format_spec)
+
+
+# One prime per rank, deuce to ace, used by the Cactus-Kev card encoding
+RANK_PRIMES: Tuple[int, ...] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+_RANKS: Tuple[Rank, ...] = tuple(Rank)
+_SUIT_BITS: Dict[Suit, int] = {suit: 1 << i for i, suit in enumerate(Suit)}
+_SUITS_BY_BIT: Dict[int, Suit] = {bit: suit for suit, bit in _SUIT_BITS.items()}
 
 
 class Card:
-    def __init__(self, rank: Rank, suit: Suit) -> None:
-        self.rank = rank
-        self.suit = suit
+    # A card is a single Cactus-Kev encoded int (see poker.evaluator_tables):
+    #   xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+    # rank bit, suit bit, rank index and rank prime. The evaluator reads it
+    # directly; rank and suit are decoded from it on access.
+    #
+    # The 52 cards are created once, below, and Card(rank, suit) returns the
+    # shared instance, so equality and hashing are by identity. Each card's
+    # display string is formatted once at the same time, as is its bit in a
+    # 52-bit hand mask (13 rank bits per suit, suits in Suit order). The
+    # card's id is the index of that bit.
+    __slots__ = ("_ck", "_id", "_mask", "_str")
+
+    def __new__(cls, rank: Rank, suit: Suit) -> "Card":
+        return _CARD_POOL[rank, suit]
+
+    @property
+    def rank(self) -> Rank:
+        return _RANKS[(self._ck >> 8) & 0xF]
+
+    @property
+    def suit(self) -> Suit:
+        return _SUITS_BY_BIT[(self._ck >> 12) & 0xF]
+
+    @property
+    def id(self) -> int:
+        """The card's index from 0 to 51, suit by suit and deuce first."""
+        return self._id
+
+    def __reduce__(self) -> Tuple[type, Tuple[Rank, Suit]]:
+        # Unpickled cards resolve to the interned instance
+        return (Card, (self.rank, self.suit))
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Card":
+        # Cards are immutable and shared, so a copy is the card itself
+        return self
 
     def __str__(self) -> str:
-        return f"{self.rank}{self.suit.value}"
+        return self._str
 
     def __repr__(self) -> str:
-        return self.__str__()
+        return self._str
+
+
+def _make_card(rank: Rank, suit: Suit) -> Card:
+    card = object.__new__(Card)
+    r = rank - 2
+    suit_bit = _SUIT_BITS[suit]
+    card._ck = (1 << (16 + r)) | (suit_bit << 12) | (r << 8) | RANK_PRIMES[r]
+    card._id = 13 * (suit_bit.bit_length() - 1) + r
+    card._mask = 1 << card._id
+    card._str = f"{rank}{suit.value}"
+    return card
+
+
+_CARD_POOL: Dict[Tuple[Rank, Suit], Card] = {
+    (rank, suit): _make_card(rank, suit) for rank in Rank for suit in Suit
+}
+
+# The 52 distinct cards; cards are immutable, so every deck shares them
+_FULL_DECK: Tuple[Card, ...] = tuple(_CARD_POOL.values())
 
 
 class Deck:
+    # The deck is held as an array of indices into _FULL_DECK; dealt cards
+    # come off the end
     def __init__(self) -> None:
-        self.cards: List[Card] = [Card(rank, suit) for rank in Rank for suit in Suit]
+        self._ids: np.ndarray = np.arange(len(_FULL_DECK), dtype=np.uint8)
         self.shuffle()
 
+    @property
+    def cards(self) -> List[Card]:
+        return [_FULL_DECK[i] for i in self._ids.tolist()]
+
     def shuffle(self) -> None:
-        random.shuffle(self.cards)
+        # Sort by random 64-bit keys: a uniform permutation computed in C,
+        # drawn from the random module so random.seed() still applies
+        keys = np.frombuffer(random.randbytes(8 * self._ids.size), dtype=np.uint64)
+        self._ids = self._ids[np.argsort(keys)]
 
     def deal(self, count: int = 1) -> List[Card]:
-        if count > len(self.cards):
+        if count > self._ids.size:
             raise ValueError("Not enough cards left in the deck")
-        dealt_cards = self.cards[:count]
-        self.cards = self.cards[count:]
-        return dealt_cards
+        if count <= 0:
+            return []
+        dealt_ids = self._ids[-count:].tolist()
+        self._ids = self._ids[:-count]
+        return [_FULL_DECK[i] for i in dealt_ids]
 
 
 class ActionType(Enum):
@@ -78,7 +154,29 @@ class ActionType(Enum):
     ALL_IN = auto()
 
 
+# Plain-string names of each action type, for display paths that format whole
+# action histories
+ACTION_TYPE_NAMES: Dict[ActionType, str] = {
+    action_type: action_type.name for action_type in ActionType
+}
+
+
+# Message templates for each action type, filled with the player name and amount
+_ACTION_TEMPLATES: Dict[ActionType, str] = {
+    ActionType.FOLD: "{name} folds",
+    ActionType.CHECK: "{name} checks",
+    ActionType.CALL: "{name} calls ${amount}",
+    ActionType.BET: "{name} bets ${amount}",
+    ActionType.RAISE: "{name} raises to ${amount}",
+    ActionType.ALL_IN: "{name} goes ALL-IN with ${amount}",
+    ActionType.SMALL_BLIND: "{name} posts small blind ${amount}",
+    ActionType.BIG_BLIND: "{name} posts big blind ${amount}",
+}
+
+
 class Action:
+    __slots__ = ("action_type", "player", "amount", "round_name", "_text", "_text_key")
+
     def __init__(
         self,
         action_type: ActionType,
@@ -90,34 +188,46 @@ class Action:
         self.player = player
         self.amount = amount
         self.round_name = round_name
+        self._text: Optional[str] = None
+        self._text_key: Optional[Tuple[ActionType, int]] = None
 
     def __str__(self) -> str:
-        if self.action_type == ActionType.FOLD:
-            return f"{self.player.name} folds"
-        elif self.action_type == ActionType.CHECK:
-            return f"{self.player.name} checks"
-        elif self.action_type == ActionType.CALL:
-            return f"{self.player.name} calls ${self.amount}"
-        elif self.action_type == ActionType.BET:
-            return f"{self.player.name} bets ${self.amount}"
-        elif self.action_type == ActionType.RAISE:
-            return f"{self.player.name} raises to ${self.amount}"
-        elif self.action_type == ActionType.ALL_IN:
-            return f"{self.player.name} goes ALL-IN with ${self.amount}"
-        elif self.action_type == ActionType.SMALL_BLIND:
-            return f"{self.player.name} posts small blind ${self.amount}"
-        elif self.action_type == ActionType.BIG_BLIND:
-            return f"{self.player.name} posts big blind ${self.amount}"
-        return f"{self.player.name} performs unknown action"
+        # The engine adjusts type and amount during validation, so the cached
+        # text is only reused while both are unchanged
+        key = (self.action_type, self.amount)
+        if self._text_key != key:
+            template = _ACTION_TEMPLATES.get(
+                self.action_type, "{name} performs unknown action"
+            )
+            self._text = template.format(name=self.player.name, amount=self.amount)
+            self._text_key = key
+        return self._text
 
 
 class InformationSet:
+    __slots__ = (
+        "community_cards",
+        "pot",
+        "current_bet",
+        "player_states",
+        "action_history",
+        "_actions_by_round",
+        "dealer_position",
+        "current_round",
+        "active_player",
+        "num_active_players",
+        "min_call_amount",
+        "big_blind",
+        "small_blind",
+    )
+
     def __init__(self, big_blind: int = 0, small_blind: int = 0) -> None:
-        self.community_cards: List[Card] = []
+        self.community_cards: Tuple[Card, ...] = ()
         self.pot: int = 0
         self.current_bet: int = 0
         self.player_states: Dict[str, Dict[str, Any]] = {}
         self.action_history: List[Action] = []
+        self._actions_by_round: Dict[str, List[Action]] = defaultdict(list)
         self.dealer_position: int = 0
         self.current_round: str = ""
         self.active_player: Optional["Agent"] = None
@@ -128,9 +238,10 @@ class InformationSet:
 
     def add_action(self, action: Action) -> None:
         self.action_history.append(action)
+        self._actions_by_round[action.round_name].append(action)
 
     def get_actions_in_round(self, round_name: str) -> List[Action]:
-        return [a for a in self.action_history if a.round_name == round_name]
+        return self._actions_by_round.get(round_name, [])
 
     def get_last_action(self) -> Optional[Action]:
         if not self.action_history:
@@ -139,20 +250,23 @@ class InformationSet:
 
 
 class Agent(ABC):
+    # Subclasses without slots of their own still get a __dict__ for extra state
+    __slots__ = ("name", "chips", "hand", "folded", "current_bet")
+
     def __init__(self, name: str, initial_chips: int = 1000) -> None:
         self.name: str = name
         self.chips: int = initial_chips
-        self.hand: List[Card] = []
+        self.hand: Tuple[Card, ...] = ()
         self.folded: bool = False
         self.current_bet: int = 0
 
     def reset_hand(self) -> None:
-        self.hand = []
+        self.hand = ()
         self.folded = False
         self.current_bet = 0
 
     def receive_cards(self, cards: List[Card]) -> None:
-        self.hand.extend(cards)
+        self.hand = (*self.hand, *cards)
 
     @abstractmethod
     def make_decision(self, info_set: InformationSet) -> Action:
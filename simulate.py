@@ -15,6 +15,10 @@ from poker.agents import AdvancedPlayer, ComputerPlayer, RandomPlayer
 from poker.engine import Game
 from poker.models import Agent
 
+# AI player classes to pick from, and the name prefix used for each
+PLAYER_TYPES = (ComputerPlayer, RandomPlayer, AdvancedPlayer)
+PLAYER_PREFIXES = {cls: cls.__name__.upper()[:3] for cls in PLAYER_TYPES}
+
 
 def run_simulation(
     num_games: int = 1,
@@ -37,43 +41,41 @@ def run_simulation(
     print("-" * 50)
 
     # Run the specified number of games
+    game = None
     for game_num in range(1, num_games + 1):
         print(f"\nStarting Game {game_num}")
 
         # Create players with random types
-        player_types = [ComputerPlayer, RandomPlayer, AdvancedPlayer]
+        chosen = random.choices(PLAYER_TYPES, k=num_players)
         players = [
-            player_type(f"{player_type.__name__.upper()[:3]}_{i + 1}", starting_chips)
-            for i in range(num_players)
-            for player_type in [random.choice(player_types)]
+            player_type(f"{PLAYER_PREFIXES[player_type]}_{i + 1}", starting_chips)
+            for i, player_type in enumerate(chosen)
         ]
 
-        # Create game
-        game = Game(players, small_blind, big_blind)
+        # Create the game once and reuse it for later games
+        if game is None:
+            game = Game(players, small_blind, big_blind)
 
-        # Set verbose mode
-        if hasattr(game.logger, "set_verbose"):
-            game.logger.set_verbose(verbose)
+            # Set verbose mode and write log output once per hand
+            if hasattr(game.logger, "set_verbose"):
+                game.logger.set_verbose(verbose)
+            game.logger.set_buffered(True)
+        else:
+            game.reset(players)
 
         # Play hands
         for _ in range(hands_per_game):
             # Play the hand
             game.play_hand()
 
-            # Remove players with 0 chips
-            game.players = [p for p in game.players if p.chips > 0]
-
             # If fewer than 2 players remain, end the game
-            if len(game.players) < 2:
+            if not game.advance_to_next_hand():
                 print("Game ended early: only one player remains")
                 break
 
-            # Update dealer position
-            if game.players:  # Make sure there are still players
-                game.dealer_idx = (game.dealer_idx + 1) % len(game.players)
-
         # Print statistics for this game
         game.print_stats()
+        game.logger.flush()
 
     print(f"Simulation complete at {datetime.now().strftime('%Y%m%d_%H%M%S')}")
 
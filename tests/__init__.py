@@ -1 +1,3 @@
-# Test package for the poker solver project 
\ No newline at end of file
+# Test package for the poker solver project
+# Tests are independent of each other and of the order they run in, so the
+# suite can be spread across processes with: python -m pytest -n auto
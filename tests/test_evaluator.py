@@ -1,200 +1,313 @@
+import random
 import unittest
+import numpy as np
 from poker.models import Card, Rank, Suit
-from poker.evaluator import HandEvaluator
-from typing import List, Tuple
+from poker.evaluator import HandEvaluator, evaluate_batch, evaluate_mask
+from poker.evaluator_tables import CLASS_SCORES, NUM_CLASSES
+from typing import Dict, List, Tuple
+
+# Every card by its short name, e.g. "Ah" for the ace of hearts, "Td" for the
+# ten of diamonds
+CARDS: Dict[str, Card] = {
+    f"{'T' if rank is Rank.TEN else rank}{suit.name[0].lower()}": Card(rank, suit)
+    for rank in Rank
+    for suit in Suit
+}
 
 
 class TestHandEvaluator(unittest.TestCase):
     def test_royal_flush(self) -> None:
         """Test detection of a royal flush."""
-        hand: List[Card] = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.KING, Suit.HEARTS)
-        ]
+        hand: List[Card] = [CARDS["Ah"], CARDS["Kh"]]
         community: List[Card] = [
-            Card(Rank.QUEEN, Suit.HEARTS),
-            Card(Rank.JACK, Suit.HEARTS),
-            Card(Rank.TEN, Suit.HEARTS),
-            Card(Rank.TWO, Suit.CLUBS),
-            Card(Rank.THREE, Suit.DIAMONDS)
+            CARDS["Qh"],
+            CARDS["Jh"],
+            CARDS["Th"],
+            CARDS["2c"],
+            CARDS["3d"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 9)  # Royal flush has rank 9
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Royal Flush")
-    
+
     def test_straight_flush(self) -> None:
         """Test detection of a straight flush."""
-        hand: List[Card] = [
-            Card(Rank.NINE, Suit.SPADES),
-            Card(Rank.EIGHT, Suit.SPADES)
-        ]
+        hand: List[Card] = [CARDS["9s"], CARDS["8s"]]
         community: List[Card] = [
-            Card(Rank.SEVEN, Suit.SPADES),
-            Card(Rank.SIX, Suit.SPADES),
-            Card(Rank.FIVE, Suit.SPADES),
-            Card(Rank.TWO, Suit.CLUBS),
-            Card(Rank.THREE, Suit.DIAMONDS)
+            CARDS["7s"],
+            CARDS["6s"],
+            CARDS["5s"],
+            CARDS["2c"],
+            CARDS["3d"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 8)  # Straight flush has rank 8
         self.assertEqual(result[1][0], 9)  # Highest card is 9
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Straight Flush")
-    
+
     def test_four_of_a_kind(self) -> None:
         """Test detection of four of a kind."""
-        hand: List[Card] = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.ACE, Suit.DIAMONDS)
-        ]
+        hand: List[Card] = [CARDS["Ah"], CARDS["Ad"]]
         community: List[Card] = [
-            Card(Rank.ACE, Suit.CLUBS),
-            Card(Rank.ACE, Suit.SPADES),
-            Card(Rank.KING, Suit.HEARTS),
-            Card(Rank.QUEEN, Suit.CLUBS),
-            Card(Rank.JACK, Suit.DIAMONDS)
+            CARDS["Ac"],
+            CARDS["As"],
+            CARDS["Kh"],
+            CARDS["Qc"],
+            CARDS["Jd"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 7)  # Four of a kind has rank 7
         self.assertEqual(result[1][0], 14)  # Four aces (value 14)
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Four of a Kind")
-    
+
     def test_full_house(self) -> None:
         """Test detection of a full house."""
-        hand: List[Card] = [
-            Card(Rank.KING, Suit.HEARTS),
-            Card(Rank.KING, Suit.DIAMONDS)
-        ]
+        hand: List[Card] = [CARDS["Kh"], CARDS["Kd"]]
         community: List[Card] = [
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.HEARTS),
-            Card(Rank.JACK, Suit.CLUBS),
-            Card(Rank.TEN, Suit.DIAMONDS)
+            CARDS["Kc"],
+            CARDS["Qs"],
+            CARDS["Qh"],
+            CARDS["Jc"],
+            CARDS["Td"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 6)  # Full house has rank 6
         self.assertEqual(result[1][0], 13)  # Three kings (value 13)
         self.assertEqual(result[1][1], 12)  # Two queens (value 12)
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Full House")
-    
+
+    def test_full_house_from_two_trips(self) -> None:
+        """Test that two sets of trips make a full house."""
+        hand: List[Card] = [CARDS["As"], CARDS["Ac"]]
+        community: List[Card] = [
+            CARDS["Ah"],
+            CARDS["4s"],
+            CARDS["4c"],
+            CARDS["4d"],
+            CARDS["Kd"],
+        ]
+
+        result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
+        self.assertEqual(result, (6, [14, 4]))  # Aces full of fours
+
+    def test_full_house_uses_highest_pair(self) -> None:
+        """Test that a full house with two pairs available uses the higher pair."""
+        hand: List[Card] = [CARDS["3s"], CARDS["3d"]]
+        community: List[Card] = [
+            CARDS["Jh"],
+            CARDS["Ad"],
+            CARDS["Js"],
+            CARDS["Ac"],
+            CARDS["3c"],
+        ]
+
+        result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
+        self.assertEqual(result, (6, [3, 14]))  # Threes full of aces
+
     def test_flush(self) -> None:
         """Test detection of a flush."""
-        hand: List[Card] = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.KING, Suit.HEARTS)
-        ]
+        hand: List[Card] = [CARDS["Ah"], CARDS["Kh"]]
         community: List[Card] = [
-            Card(Rank.JACK, Suit.HEARTS),
-            Card(Rank.SEVEN, Suit.HEARTS),
-            Card(Rank.THREE, Suit.HEARTS),
-            Card(Rank.TWO, Suit.CLUBS),
-            Card(Rank.FOUR, Suit.DIAMONDS)
+            CARDS["Jh"],
+            CARDS["7h"],
+            CARDS["3h"],
+            CARDS["2c"],
+            CARDS["4d"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 5)  # Flush has rank 5
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Flush")
-    
+
     def test_straight(self) -> None:
         """Test detection of a straight."""
-        hand: List[Card] = [
-            Card(Rank.NINE, Suit.HEARTS),
-            Card(Rank.EIGHT, Suit.DIAMONDS)
-        ]
+        hand: List[Card] = [CARDS["9h"], CARDS["8d"]]
         community: List[Card] = [
-            Card(Rank.SEVEN, Suit.CLUBS),
-            Card(Rank.SIX, Suit.SPADES),
-            Card(Rank.FIVE, Suit.HEARTS),
-            Card(Rank.TWO, Suit.CLUBS),
-            Card(Rank.THREE, Suit.DIAMONDS)
+            CARDS["7c"],
+            CARDS["6s"],
+            CARDS["5h"],
+            CARDS["2c"],
+            CARDS["3d"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 4)  # Straight has rank 4
         self.assertEqual(result[1][0], 9)  # Highest card is 9
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Straight")
-    
+
     def test_three_of_a_kind(self) -> None:
         """Test detection of three of a kind."""
-        hand: List[Card] = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.ACE, Suit.DIAMONDS)
-        ]
+        hand: List[Card] = [CARDS["Ah"], CARDS["Ad"]]
         community: List[Card] = [
-            Card(Rank.ACE, Suit.CLUBS),
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.HEARTS),
-            Card(Rank.NINE, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.DIAMONDS)
+            CARDS["Ac"],
+            CARDS["Ks"],
+            CARDS["Qh"],
+            CARDS["9c"],
+            CARDS["7d"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 3)  # Three of a kind has rank 3
         self.assertEqual(result[1][0], 14)  # Three aces (value 14)
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Three of a Kind")
-    
+
     def test_two_pair(self) -> None:
         """Test detection of two pair."""
-        hand: List[Card] = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.ACE, Suit.DIAMONDS)
-        ]
+        hand: List[Card] = [CARDS["Ah"], CARDS["Ad"]]
         community: List[Card] = [
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.KING, Suit.SPADES),
-            Card(Rank.QUEEN, Suit.HEARTS),
-            Card(Rank.EIGHT, Suit.CLUBS),
-            Card(Rank.SIX, Suit.DIAMONDS)
+            CARDS["Kc"],
+            CARDS["Ks"],
+            CARDS["Qh"],
+            CARDS["8c"],
+            CARDS["6d"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 2)  # Two pair has rank 2
         self.assertEqual(result[1][0], 14)  # Pair of aces (value 14)
         self.assertEqual(result[1][1], 13)  # Pair of kings (value 13)
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Two Pair")
-    
+
     def test_pair(self) -> None:
         """Test detection of a pair."""
-        hand: List[Card] = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.ACE, Suit.DIAMONDS)
-        ]
+        hand: List[Card] = [CARDS["Ah"], CARDS["Ad"]]
         community: List[Card] = [
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.SPADES),
-            Card(Rank.JACK, Suit.HEARTS),
-            Card(Rank.NINE, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.DIAMONDS)
+            CARDS["Kc"],
+            CARDS["Qs"],
+            CARDS["Jh"],
+            CARDS["9c"],
+            CARDS["7d"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 1)  # Pair has rank 1
         self.assertEqual(result[1][0], 14)  # Pair of aces (value 14)
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "Pair")
-    
+
     def test_high_card(self) -> None:
         """Test detection of high card."""
-        hand: List[Card] = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.TEN, Suit.DIAMONDS)
-        ]
+        hand: List[Card] = [CARDS["Ah"], CARDS["Td"]]
         community: List[Card] = [
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.SPADES),
-            Card(Rank.EIGHT, Suit.HEARTS),
-            Card(Rank.SIX, Suit.CLUBS),
-            Card(Rank.FOUR, Suit.DIAMONDS)
+            CARDS["Kc"],
+            CARDS["Qs"],
+            CARDS["8h"],
+            CARDS["6c"],
+            CARDS["4d"],
         ]
-        
+
         result: Tuple[int, List[int]] = HandEvaluator.evaluate(hand, community)
         self.assertEqual(result[0], 0)  # High card has rank 0
         self.assertEqual(result[1][0], 14)  # Ace high (value 14)
         self.assertEqual(HandEvaluator.hand_type_to_string(result), "High Card")
 
+    def test_evaluate_mask_class_bounds(self) -> None:
+        """Test the bitmask kernel on the best and worst possible hands."""
+        royal = 0
+        for name in "As Ks Qs Js Ts".split():
+            royal |= CARDS[name]._mask
+        worst = 0
+        for name in "7h 5c 4d 3s 2h".split():
+            worst |= CARDS[name]._mask
+
+        self.assertEqual(evaluate_mask(royal), 1)
+        self.assertEqual(evaluate_mask(worst), NUM_CLASSES)
+
+    def test_evaluate_mask_matches_evaluate_batch(self) -> None:
+        """Test that bitmask evaluation agrees with the encoded-card batch path."""
+        for names in (
+            "Ah Kh Qh Jh Th 2c 3d",  # Royal flush
+            "9s 8s 7s 6s 5s 2c 3d",  # Straight flush
+            "As Ac Ah 4s 4c 4d Kd",  # Full house from two trips
+            "Ah Kh Jh 7h 3h 2c 4d",  # Flush
+            "Ah Td Kc Qs 8h 6c 4d",  # High card
+            "7h 5c 4d 3s 2h",  # Worst hand
+        ):
+            with self.subTest(names):
+                cards: List[Card] = [CARDS[name] for name in names.split()]
+                mask = 0
+                for card in cards:
+                    mask |= card._mask
+                card_ints = [card._ck for card in cards]
+
+                categories, kickers = evaluate_batch([card_ints])
+                category, ranks = CLASS_SCORES[evaluate_mask(mask)]
+                self.assertEqual(categories[0], category)
+                self.assertEqual(
+                    kickers[0], sum(k << (16 - 4 * i) for i, k in enumerate(ranks))
+                )
+
+    def test_evaluate_ignores_card_order(self) -> None:
+        """Test that a hand scores the same however its cards are ordered or split."""
+        cards: List[Card] = [CARDS[name] for name in "3s 3d Jh Ad Js Ac 3c".split()]
+        expected = HandEvaluator.evaluate(cards[:2], cards[2:])
+
+        shuffler = random.Random(7)
+        for _ in range(20):
+            shuffler.shuffle(cards)
+            self.assertEqual(HandEvaluator.evaluate(cards[:2], cards[2:]), expected)
+            self.assertEqual(HandEvaluator.evaluate(cards[:4], cards[4:]), expected)
+
+    def test_evaluate_ids_matches_evaluate(self) -> None:
+        """Test that scoring cards by id agrees with scoring the Card objects."""
+        self.assertEqual(sorted(card.id for card in CARDS.values()), list(range(52)))
+
+        for names in (
+            "Ah Kh Qh Jh Th 2c 3d",  # Royal flush
+            "As Ac Ah 4s 4c 4d Kd",  # Full house from two trips
+            "7h 5c 4d 3s 2h",  # Worst hand
+        ):
+            with self.subTest(names):
+                cards: List[Card] = [CARDS[name] for name in names.split()]
+                ids = np.array([card.id for card in cards], dtype=np.uint8)
+
+                self.assertEqual(
+                    HandEvaluator.evaluate_ids(ids),
+                    HandEvaluator.evaluate(cards[:2], cards[2:]),
+                )
+
+    def test_evaluate_rejects_invalid_cards(self) -> None:
+        """Test that repeated cards and unknown card ids are rejected."""
+        with self.assertRaises(ValueError):
+            HandEvaluator.evaluate_ids([0, 0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            HandEvaluator.evaluate_ids([0, 1, 2, 3, 60])
+        community: List[Card] = [CARDS["Kh"], CARDS["Qh"], CARDS["Jh"]]
+        with self.assertRaises(ValueError):
+            HandEvaluator.evaluate([CARDS["Ah"], CARDS["Ah"]], community)
+
+    def test_evaluate_batch_matches_evaluate(self) -> None:
+        """Test that batch evaluation agrees with evaluating hands one by one."""
+        hands: List[List[Card]] = [
+            [CARDS[name] for name in names.split()]
+            for names in (
+                "Ah Kh Qh Jh Th 2c 3d",  # Royal flush
+                "As Ac Ah 4s 4c 4d Kd",  # Full house from two trips
+                "9h 8d 7c 6s 5h 2c 3d",  # Straight
+                "Ah Ad Kc Ks Qh 8c 6d",  # Two pair, queen kicker
+                "Ah Ad Kc Ks 8h 7c 6d",  # Two pair, eight kicker
+                "Ah Td Kc Qs 8h 6c 4d",  # High card
+            )
+        ]
+        card_ints = np.array([[card._ck for card in hand] for hand in hands])
+
+        categories, kickers = evaluate_batch(card_ints)
+        for hand, category, packed in zip(hands, categories.tolist(), kickers.tolist()):
+            expected = HandEvaluator.evaluate(hand[:2], hand[2:])
+            self.assertEqual(category, expected[0])
+            self.assertEqual(
+                packed, sum(k << (16 - 4 * i) for i, k in enumerate(expected[1]))
+            )
+
+        # Packed kickers order hands within a category
+        self.assertGreater(kickers[3], kickers[4])
+
+        with self.assertRaises(ValueError):
+            evaluate_batch(card_ints[:, :4])
+
 
 if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
@@ -1,7 +1,9 @@
+import copy
 import random
 import unittest
+from unittest.mock import Mock
 
-from poker.models import Card, Deck, Rank, Suit
+from poker.models import Action, ActionType, Card, Deck, InformationSet, Rank, Suit
 
 
 class TestCard(unittest.TestCase):
@@ -31,6 +33,20 @@ class TestCard(unittest.TestCase):
         card = Card(Rank.TWO, Suit.CLUBS)
         self.assertEqual(str(card), "2♣")
 
+    def test_card_equality(self) -> None:
+        """Test that cards compare and hash by rank and suit."""
+        self.assertEqual(Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.SPADES))
+        self.assertIs(Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.SPADES))
+        self.assertIs(
+            copy.deepcopy(Card(Rank.ACE, Suit.SPADES)), Card(Rank.ACE, Suit.SPADES)
+        )
+        self.assertNotEqual(Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS))
+        self.assertNotEqual(Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES))
+        self.assertEqual(
+            len({Card(rank, suit) for rank in Rank for suit in Suit for _ in range(2)}),
+            52,
+        )
+
 
 class TestDeck(unittest.TestCase):
     def test_deck_initialization(self) -> None:
@@ -135,5 +151,37 @@ class TestSuit(unittest.TestCase):
         self.assertEqual(Suit.SPADES.value, "♠")
 
 
+class TestAction(unittest.TestCase):
+    def test_action_string_representation(self) -> None:
+        """Test the string representation of an action."""
+        player = Mock()
+        player.name = "P1"
+        action = Action(ActionType.CALL, player, 20, "Flop")
+        self.assertEqual(str(action), "P1 calls $20")
+        self.assertEqual(
+            str(Action(ActionType.RAISE, player, 60)), "P1 raises to $60"
+        )
+
+        # The text follows changes made to the action after construction
+        action.action_type = ActionType.ALL_IN
+        action.amount = 15
+        self.assertEqual(str(action), "P1 goes ALL-IN with $15")
+
+
+class TestInformationSet(unittest.TestCase):
+    def test_actions_in_round(self) -> None:
+        """Test that actions are indexed by the round they were taken in."""
+        info_set = InformationSet()
+        flop_check = Action(ActionType.CHECK, None, 0, "Flop")
+        flop_bet = Action(ActionType.BET, None, 20, "Flop")
+        turn_fold = Action(ActionType.FOLD, None, 0, "Turn")
+        for action in (flop_check, flop_bet, turn_fold):
+            info_set.add_action(action)
+
+        self.assertEqual(info_set.get_actions_in_round("Flop"), [flop_check, flop_bet])
+        self.assertEqual(info_set.get_actions_in_round("Turn"), [turn_fold])
+        self.assertEqual(info_set.get_actions_in_round("River"), [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,5 @@
-import os
-import sys
 import unittest
-from unittest.mock import MagicMock, patch
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import patch
 
 from poker.engine import Game
 from poker.models import Action, ActionType, Agent, Card, InformationSet, Rank, Suit
@@ -15,25 +10,84 @@ class TestAgent(Agent):
 
     def __init__(self, name: str, chips: int = 1000, actions=None):
         super().__init__(name, chips)
-        self.actions = actions or []
+        self.actions = actions
+
+    @property
+    def actions(self):
+        return self._actions
+
+    @actions.setter
+    def actions(self, actions):
+        # Predefined actions are consumed in order through an iterator
+        self._actions = actions or []
+        self._actions_iter = iter(self._actions)
         self.action_idx = 0
 
     def make_decision(self, info_set: InformationSet) -> Action:
         """Return the next predefined action, or fold if no more actions are available"""
-        if self.action_idx < len(self.actions):
-            action = self.actions[self.action_idx]
-            # Update action's player if it's not set
-            if action.player is None:
-                action.player = self
-            self.action_idx += 1
-            return action
-        return Action(ActionType.FOLD, self, 0, info_set.current_round)
+        action = next(self._actions_iter, None)
+        if action is None:
+            return Action(ActionType.FOLD, self, 0, info_set.current_round)
+        # Update action's player if it's not set
+        if action.player is None:
+            action.player = self
+        self.action_idx += 1
+        return action
+
+
+class _FixedDeck:
+    """Test deck that deals predefined cards in order"""
+
+    __slots__ = ("cards", "idx")
+
+    def __init__(self, cards):
+        self.cards = cards
+        self.idx = 0
+
+    def shuffle(self):
+        pass
+
+    def deal(self, count):
+        cards = list(self.cards[self.idx : self.idx + count])
+        self.idx += count
+        return cards
+
+
+# Deck for test_full_hand, in dealing order
+_FULL_HAND_DECK = (
+    # Player hands
+    Card(Rank.ACE, Suit.HEARTS),
+    Card(Rank.ACE, Suit.HEARTS),  # Player 1
+    Card(Rank.KING, Suit.HEARTS),
+    Card(Rank.KING, Suit.HEARTS),  # Player 2
+    Card(Rank.QUEEN, Suit.HEARTS),
+    Card(Rank.QUEEN, Suit.HEARTS),  # Player 3
+    # Community cards
+    Card(Rank.JACK, Suit.HEARTS),
+    Card(Rank.TEN, Suit.HEARTS),
+    Card(Rank.ACE, Suit.SPADES),  # Flop
+    Card(Rank.KING, Suit.SPADES),  # Turn
+    Card(Rank.QUEEN, Suit.SPADES),  # River
+)
 
 
 class TestPokerGame(unittest.TestCase):
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def setUp(self, mock_print, mock_sleep):
+    @classmethod
+    def setUpClass(cls):
+        """Patch out sleeps and console output once for every test in the class"""
+        cls._patchers = [
+            patch("time.sleep", return_value=None),  # Skip all sleep calls
+            patch("builtins.print"),  # Skip all print statements
+        ]
+        for patcher in cls._patchers:
+            patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in cls._patchers:
+            patcher.stop()
+
+    def setUp(self):
         # Create test players with predefined actions
         self.player1 = TestAgent("Player1", 1000)
         self.player2 = TestAgent("Player2", 1000)
@@ -56,15 +110,11 @@ class TestPokerGame(unittest.TestCase):
             [self.player1, self.player2, self.player3], small_blind=5, big_blind=10
         )
 
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def test_blinds_posting(self, mock_print, mock_sleep):
+    def test_blinds_posting(self):
         """Test that blinds are posted correctly"""
-        self.game.deck = MagicMock()  # Mock the deck to avoid randomness
-
-        # Setup predefined cards for the deck
+        # Use a fixed deck to avoid randomness
         hearts_ace = Card(Rank.ACE, Suit.HEARTS)
-        self.game.deck.deal.return_value = [hearts_ace, hearts_ace]
+        self.game.deck = _FixedDeck([hearts_ace, hearts_ace])
 
         # Post blinds
         self.game.current_round = "Blinds"
@@ -82,9 +132,7 @@ class TestPokerGame(unittest.TestCase):
         self.assertEqual(self.game.pot, 15)
         self.assertEqual(self.game.current_bet, 10)
 
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def test_all_check_betting_round(self, mock_print, mock_sleep):
+    def test_all_check_betting_round(self):
         """Test a betting round where everyone checks"""
         # Setup actions for all players
         player1_actions = [Action(ActionType.CHECK, self.player1, 0, "Flop")]
@@ -106,9 +154,7 @@ class TestPokerGame(unittest.TestCase):
         self.assertEqual(self.player2.chips, 1000)
         self.assertEqual(self.player3.chips, 1000)
 
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def test_bet_and_call_betting_round(self, mock_print, mock_sleep):
+    def test_bet_and_call_betting_round(self):
         """Test a betting round where one player bets and others call"""
         # Setup actions for all players
         player1_actions = [Action(ActionType.BET, self.player1, 50, "Flop")]
@@ -130,9 +176,7 @@ class TestPokerGame(unittest.TestCase):
         self.assertEqual(self.player2.chips, 950)
         self.assertEqual(self.player3.chips, 950)
 
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def test_fold_in_betting_round(self, mock_print, mock_sleep):
+    def test_fold_in_betting_round(self):
         """Test a betting round where some players fold"""
         # Setup actions for all players
         player1_actions = [Action(ActionType.BET, self.player1, 50, "Flop")]
@@ -155,9 +199,15 @@ class TestPokerGame(unittest.TestCase):
         self.assertEqual(self.player3.chips, 950)
         self.assertTrue(self.player2.folded)
 
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def test_raise_in_betting_round(self, mock_print, mock_sleep):
+        # Verify each processed action was counted once
+        self.assertEqual(self.game.stats["bets"], 1)
+        self.assertEqual(self.game.stats["folds"], 1)
+        self.assertEqual(self.game.stats["calls"], 1)
+
+        # Processed actions are not retained unless requested
+        self.assertEqual(self.game.actions_taken, [])
+
+    def test_raise_in_betting_round(self):
         """Test a betting round with raises"""
         # Setup actions for all players
         player1_actions = [
@@ -187,9 +237,7 @@ class TestPokerGame(unittest.TestCase):
         self.assertEqual(self.player2.chips, 900)
         self.assertEqual(self.player3.chips, 900)
 
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def test_all_in_betting_round(self, mock_print, mock_sleep):
+    def test_all_in_betting_round(self):
         """Test a betting round with an all-in"""
         # Setup player with low chips
         player1 = TestAgent("Player1", 100)
@@ -228,9 +276,7 @@ class TestPokerGame(unittest.TestCase):
         self.assertEqual(player2.chips, 900)
         self.assertEqual(player3.chips, 900)
 
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def test_bet_call_check_bug(self, mock_print, mock_sleep):
+    def test_bet_call_check_bug(self):
         """Test the specific bug where after a bet and call, player is asked to check again"""
         # Setup actions for all players
         player1_actions = [Action(ActionType.BET, self.player1, 50, "Flop")]
@@ -254,20 +300,79 @@ class TestPokerGame(unittest.TestCase):
         self.assertEqual(self.player2.action_idx, 1)
         self.assertEqual(self.player3.action_idx, 1)
 
-    @patch("time.sleep", return_value=None)  # Skip all sleep calls
-    @patch("builtins.print")  # Skip all print statements
-    def test_full_hand(self, mock_print, mock_sleep):
-        """Test a full hand from start to finish"""
-        # Create a deterministic deck
-        hearts_ace = Card(Rank.ACE, Suit.HEARTS)
-        hearts_king = Card(Rank.KING, Suit.HEARTS)
-        hearts_queen = Card(Rank.QUEEN, Suit.HEARTS)
-        hearts_jack = Card(Rank.JACK, Suit.HEARTS)
-        hearts_ten = Card(Rank.TEN, Suit.HEARTS)
-        spades_ace = Card(Rank.ACE, Suit.SPADES)
-        spades_king = Card(Rank.KING, Suit.SPADES)
-        spades_queen = Card(Rank.QUEEN, Suit.SPADES)
+    def test_advance_to_next_hand(self):
+        """Test that busted players are removed and the dealer button moves"""
+        self.player2.chips = 0
+        self.game.dealer_idx = 0
+
+        self.assertTrue(self.game.advance_to_next_hand())
+        self.assertEqual(self.game.players, [self.player1, self.player3])
+        self.assertEqual(self.game.dealer_idx, 1)
+
+        # Only one player left: the game cannot continue
+        self.player3.chips = 0
+        self.assertFalse(self.game.advance_to_next_hand())
+        self.assertEqual(self.game.players, [self.player1])
+
+    def test_player_without_chips_sits_out_hand(self):
+        """Test that a player starting a hand with no chips is not dealt in"""
+        self.player1.chips = 0
+        self.player2.actions = [
+            Action(ActionType.CALL, self.player2, 10, "Pre-Flop"),
+            Action(ActionType.CHECK, self.player2, 0, "Flop"),
+            Action(ActionType.CHECK, self.player2, 0, "Turn"),
+            Action(ActionType.CHECK, self.player2, 0, "River"),
+        ]
+        self.player3.actions = [
+            Action(ActionType.CHECK, self.player3, 0, round_name)
+            for round_name in ("Pre-Flop", "Flop", "Turn", "River")
+        ]
 
+        # Player1's aces would win the showdown if they were dealt in
+        deck = _FixedDeck(
+            (
+                Card(Rank.ACE, Suit.HEARTS),
+                Card(Rank.ACE, Suit.SPADES),  # Player 1
+                Card(Rank.SEVEN, Suit.CLUBS),
+                Card(Rank.TWO, Suit.DIAMONDS),  # Player 2
+                Card(Rank.EIGHT, Suit.HEARTS),
+                Card(Rank.THREE, Suit.CLUBS),  # Player 3
+                Card(Rank.KING, Suit.DIAMONDS),
+                Card(Rank.QUEEN, Suit.CLUBS),
+                Card(Rank.FIVE, Suit.HEARTS),  # Flop
+                Card(Rank.FOUR, Suit.SPADES),  # Turn
+                Card(Rank.NINE, Suit.DIAMONDS),  # River
+            )
+        )
+        with patch("poker.engine.Deck", return_value=deck):
+            self.game.play_hand()
+
+        self.assertTrue(self.player1.folded)
+        self.assertEqual(self.player1.chips, 0)
+        self.assertEqual(self.player2.chips + self.player3.chips, 2000)
+
+    def test_reset(self):
+        """Test that reset clears per-game state and reuses the stats dicts"""
+        self.game.hand_counter = 3
+        self.game.stats["hands_played"] = 3
+        self.game.stats["player_wins"]["Player1"] = 2
+        player_wins = self.game.stats["player_wins"]
+
+        new_players = [TestAgent("Player4", 500), TestAgent("Player5", 500)]
+        self.game.reset(new_players)
+
+        self.assertIs(self.game.players, new_players)
+        self.assertEqual(self.game.hand_counter, 0)
+        self.assertEqual(self.game.initial_total_chips, 1000)
+        self.assertEqual(self.game.stats["hands_played"], 0)
+        self.assertIs(self.game.stats["player_wins"], player_wins)
+        self.assertEqual(player_wins, {"Player4": 0, "Player5": 0})
+        self.assertEqual(
+            self.game.stats["final_chips"], {"Player4": 500, "Player5": 500}
+        )
+
+    def test_full_hand(self):
+        """Test a full hand from start to finish"""
         # Create players first
         player1 = TestAgent("Player1", 1000)
         player2 = TestAgent("Player2", 1000)
@@ -324,33 +429,8 @@ class TestPokerGame(unittest.TestCase):
         # Create the game with these players
         self.game = Game([player1, player2, player3], small_blind=5, big_blind=10)
 
-        # Create a custom deck
-        class TestDeck:
-            def __init__(self):
-                self.cards = [
-                    # Player hands
-                    hearts_ace,
-                    hearts_ace,  # Player 1
-                    hearts_king,
-                    hearts_king,  # Player 2
-                    hearts_queen,
-                    hearts_queen,  # Player 3
-                    # Community cards
-                    hearts_jack,
-                    hearts_ten,
-                    spades_ace,  # Flop
-                    spades_king,  # Turn
-                    spades_queen,  # River
-                ]
-                self.idx = 0
-
-            def deal(self, count):
-                cards = self.cards[self.idx : self.idx + count]
-                self.idx += count
-                return cards
-
-        # Replace the game's deck with our test deck
-        self.game.deck = TestDeck()
+        # Replace the game's deck with a deck dealing known cards
+        self.game.deck = _FixedDeck(_FULL_HAND_DECK)
 
         # Run a full hand
         self.game.play_hand()